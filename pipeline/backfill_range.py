@@ -5,20 +5,34 @@ from __future__ import annotations
 
 import argparse
 import concurrent.futures
+import dataclasses
+import functools
+import itertools
 import json
 import logging
 import os
 import random
+import signal
 import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Mapping, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
 
 import london_bike_pipeline as bike_pipeline
 
 LOGGER = logging.getLogger("london-bike-backfill")
+EARLY_REJECT_FAILURE_RATE = 0.2
+PROBE_ROW_GROUPS = 8
+# Marker left by earlier recompress passes, which always wrote zstd level 9.
+LEGACY_RECOMPRESSED_METADATA_KEY = b"locatr.recompressed"
+LEGACY_RECOMPRESSED_LEVEL = 9
 
 
 def month_floor(value: datetime) -> datetime:
@@ -26,22 +40,18 @@ def month_floor(value: datetime) -> datetime:
 
 
 def shift_month(value: datetime, delta: int) -> datetime:
-    year = value.year
-    month = value.month + delta
-    while month > 12:
-        year += 1
-        month -= 12
-    while month < 1:
-        year -= 1
-        month += 12
-    return value.replace(year=year, month=month)
+    if delta == 0:
+        return value
+    year, month_index = divmod(value.year * 12 + (value.month - 1) + delta, 12)
+    return value.replace(year=year, month=month_index + 1)
 
 
 def month_string(value: datetime) -> str:
     return value.strftime("%Y-%m")
 
 
-def iter_months(start_month: str, end_month: str) -> list[str]:
+@functools.lru_cache(maxsize=None)
+def iter_months(start_month: str, end_month: str) -> tuple[str, ...]:
     current, _ = bike_pipeline.parse_month(start_month)
     end, _ = bike_pipeline.parse_month(end_month)
     if current > end:
@@ -50,28 +60,33 @@ def iter_months(start_month: str, end_month: str) -> list[str]:
     while current <= end:
         out.append(month_string(current))
         current = shift_month(current, 1)
-    return out
+    return tuple(out)
 
 
-def discover_latest_available_month(base_url: str, start_month: str) -> str:
-    session = bike_pipeline.build_http_session()
+def discover_latest_available_month(
+    base_url: str, start_month: str, listing_cache_path: Path
+) -> str:
     lower_bound, _ = bike_pipeline.parse_month(start_month)
     cursor = month_floor(datetime.now(timezone.utc))
-    while cursor >= lower_bound:
-        month_start = cursor
-        month_end = shift_month(month_start, 1)
-        try:
-            urls = bike_pipeline.discover_month_urls(
-                session=session,
-                base_url=base_url,
-                month_start=month_start,
-                month_end=month_end,
-            )
-            if urls:
-                return month_string(month_start)
-        except Exception:  # noqa: BLE001
-            pass
-        cursor = shift_month(cursor, -1)
+    # The first probe lists the bucket and saves it to the listing cache; every
+    # later probe (and every month pipeline of the backfill) filters that one
+    # listing locally, so probing newest-first needs no parallel requests.
+    with bike_pipeline.build_http_session() as session:
+        while cursor >= lower_bound:
+            try:
+                bike_pipeline.discover_month_urls(
+                    session=session,
+                    base_url=base_url,
+                    month_start=cursor,
+                    month_end=shift_month(cursor, 1),
+                    listing_cache_path=listing_cache_path,
+                )
+            except bike_pipeline.NoMonthFilesError:
+                # Only a month missing from the listing moves the probe back; listing,
+                # parse and network failures propagate instead of being read as "no data".
+                cursor = shift_month(cursor, -1)
+                continue
+            return month_string(cursor)
     raise RuntimeError("Could not discover any available month at or after --start-month.")
 
 
@@ -149,6 +164,15 @@ def parse_args() -> argparse.Namespace:
         default=20,
         help="HTTP request timeout in seconds.",
     )
+    parser.add_argument(
+        "--month-workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of months processed concurrently in worker processes "
+            "(default: min(months, CPU count)). OSRM workers/qps are split across them."
+        ),
+    )
     parser.add_argument(
         "--max-trips",
         type=int,
@@ -183,7 +207,10 @@ def parse_args() -> argparse.Namespace:
         "--auto-tune-requests",
         type=int,
         default=120,
-        help="Number of route requests to use in auto-tune benchmark.",
+        help=(
+            "Number of routes to use in auto-tune benchmark; they are sent in batches of "
+            f"{bike_pipeline.OSRM_BATCH_SIZE} per request, as the pipeline does."
+        ),
     )
     parser.add_argument(
         "--auto-tune-only",
@@ -194,13 +221,28 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--pause-file",
         default="./pipeline/output/.backfill_pause",
-        help="If this file exists, stop cleanly after current month (or skip).",
+        help=(
+            "If this file exists, stop cleanly after current month (or skip). "
+            "Sending SIGUSR1 to the backfill process (kill -USR1 <pid>) has the same effect."
+        ),
     )
     parser.add_argument(
         "--state-file",
         default="./pipeline/output/backfill_state.json",
         help="Write structured backfill progress state to this JSON file.",
     )
+    parser.add_argument(
+        "--zstd-level",
+        type=int,
+        default=bike_pipeline.DAILY_ZSTD_LEVEL,
+        help="zstd compression level for the daily parquet files written by each month.",
+    )
+    parser.add_argument(
+        "--recompress-on-complete",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="After a completed backfill, rewrite day parquet files written below --zstd-level at that level.",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -209,22 +251,80 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def month_has_output(month: str, output_dir: Path) -> bool:
-    return any(output_dir.glob(f"{month}-*.parquet"))
+def list_output_months(output_dir: Path) -> set[str]:
+    """Return the YYYY-MM prefixes of every `YYYY-MM-*.parquet` file in one directory scan."""
+    with os.scandir(output_dir) as entries:
+        return {
+            entry.name[:7]
+            for entry in entries
+            if entry.name.endswith(".parquet")
+            and len(entry.name) > 8
+            and entry.name[7] == "-"
+            and entry.is_file()
+        }
+
+
+def select_spread_row_groups(parquet_file: pq.ParquetFile, column: str, k: int) -> list[int]:
+    """Pick up to `k` row groups whose `column` min/max ranges overlap the least."""
+    metadata = parquet_file.metadata
+    column_index = parquet_file.schema_arrow.get_field_index(column)
+    intervals: list[tuple[float, float, int]] = []
+    for row_group in range(metadata.num_row_groups):
+        stats = metadata.row_group(row_group).column(column_index).statistics
+        if stats is None or not stats.has_min_max:
+            return list(range(min(k, metadata.num_row_groups)))
+        intervals.append((stats.min, stats.max, row_group))
+
+    # Greedy interval scheduling: earliest-ending disjoint ranges first.
+    disjoint: list[int] = []
+    last_max = float("-inf")
+    for low, high, row_group in sorted(intervals, key=lambda item: item[1]):
+        if low > last_max:
+            disjoint.append(row_group)
+            last_max = high
+    if len(disjoint) > k:
+        step = (len(disjoint) - 1) / max(k - 1, 1)
+        disjoint = [disjoint[round(index * step)] for index in range(k)]
+    chosen = set(disjoint)
+    for _, _, row_group in intervals:
+        if len(chosen) >= k:
+            break
+        chosen.add(row_group)
+    return sorted(chosen)
+
+
+def read_probe_table(route_cache_path: Path, columns: list[str], limit: int) -> pa.Table | None:
+    """Read spatially spread route cache row groups until they cover `limit` unique pairs."""
+    parquet_file = pq.ParquetFile(route_cache_path, memory_map=True)
+    if not set(columns).issubset(parquet_file.schema_arrow.names):
+        return None
+
+    spread = select_spread_row_groups(parquet_file, "start_lon", PROBE_ROW_GROUPS)
+    remaining = [index for index in range(parquet_file.num_row_groups) if index not in spread]
+    unique_pairs = None
+    for batch in [spread, *([index] for index in remaining)]:
+        if not batch:
+            continue
+        table = parquet_file.read_row_groups(batch, columns=columns, use_threads=True)
+        if unique_pairs is not None:
+            table = pa.concat_tables([unique_pairs, table])
+        # group_by with no aggregations yields the distinct rows without leaving Arrow.
+        unique_pairs = table.group_by(columns, use_threads=False).aggregate([])
+        if unique_pairs.num_rows >= limit:
+            break
+    return unique_pairs.select(columns) if unique_pairs is not None else None
 
 
 def load_probe_pairs(route_cache_path: Path, limit: int) -> list[tuple[float, float, float, float]]:
     column_order = ["start_lon", "start_lat", "end_lon", "end_lat"]
     if route_cache_path.exists():
-        frame = pd.read_parquet(route_cache_path, columns=column_order)
-        if set(column_order).issubset(frame.columns):
-            sample = frame[column_order].drop_duplicates(ignore_index=True)
-            if len(sample) > 0:
-                sample = sample.sample(
-                    n=min(limit, len(sample)),
-                    random_state=42,
-                )
-                return [tuple(row) for row in sample.itertuples(index=False, name=None)]
+        table = read_probe_table(route_cache_path, column_order, limit)
+        if table is not None and table.num_rows > 0:
+            rng = np.random.default_rng(42)
+            indices = rng.choice(table.num_rows, size=min(limit, table.num_rows), replace=False)
+            sample = table.take(pa.array(indices)).to_pandas()
+            coords = sample.to_numpy(dtype="float64", copy=False)
+            return list(map(tuple, coords.tolist()))
 
     fallback_points = [
         (-0.1276, 51.5074),
@@ -244,19 +344,31 @@ def load_probe_pairs(route_cache_path: Path, limit: int) -> list[tuple[float, fl
     return pairs[:limit]
 
 
-def expand_probe_pairs(
+def build_probe_batches(
     pairs: list[tuple[float, float, float, float]], target: int
-) -> list[tuple[float, float, float, float]]:
+) -> list[list[tuple[float, float, float, float]]]:
+    """Build target OSRM requests shaped like hydrate_routes' batches.
+
+    Each batch routes OSRM_BATCH_SIZE destinations from one shared origin
+    (the first pair's), so a probe costs the server what a real request does.
+    """
     if not pairs:
         raise RuntimeError("Auto-tune probe pair list is empty.")
-    if len(pairs) >= target:
-        return pairs[:target]
-    out: list[tuple[float, float, float, float]] = []
-    index = 0
-    while len(out) < target:
-        out.append(pairs[index % len(pairs)])
-        index += 1
-    return out
+    destinations = itertools.cycle(pairs)
+    batches: list[list[tuple[float, float, float, float]]] = []
+    for start_lon, start_lat, _, _ in itertools.islice(itertools.cycle(pairs), target):
+        batch: list[tuple[float, float, float, float]] = []
+        for _ in range(len(pairs)):
+            _, _, end_lon, end_lat = next(destinations)
+            if (end_lon, end_lat) != (start_lon, start_lat):
+                batch.append((start_lon, start_lat, end_lon, end_lat))
+                if len(batch) == bike_pipeline.OSRM_BATCH_SIZE:
+                    break
+        if batch:
+            batches.append(batch)
+    if not batches:
+        raise RuntimeError("Auto-tune probe pairs have no distinct destinations.")
+    return batches
 
 
 def log_overall_progress(
@@ -264,8 +376,12 @@ def log_overall_progress(
     total: int,
     overall_started_at: float,
     current_month: str,
+    now: float | None = None,
 ) -> None:
-    elapsed = max(time.monotonic() - overall_started_at, 1e-6)
+    if not LOGGER.isEnabledFor(logging.INFO):
+        return
+    now = time.monotonic() if now is None else now
+    elapsed = max(now - overall_started_at, 1e-6)
     avg_per_month = elapsed / max(completed, 1)
     remaining = max(total - completed, 0)
     eta_seconds = remaining * avg_per_month
@@ -292,11 +408,12 @@ def write_backfill_state(
     current_month: str | None,
     next_month: str | None,
     elapsed_seconds: float,
+    now_iso: str | None = None,
 ) -> None:
     state_file.parent.mkdir(parents=True, exist_ok=True)
     payload = {
         "status": status,
-        "updated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "updated_at_utc": now_iso or datetime.now(timezone.utc).isoformat(),
         "start_month": start_month,
         "end_month": end_month,
         "total_months": total_months,
@@ -308,53 +425,128 @@ def write_backfill_state(
         "next_month": next_month,
         "elapsed_seconds": round(elapsed_seconds, 2),
     }
-    state_file.write_text(f"{json.dumps(payload, indent=2)}\n", encoding="utf-8")
+    # Write next to the target and rename so a crash never leaves a truncated state file.
+    tmp_file = state_file.with_name(f"{state_file.name}.tmp")
+    tmp_file.write_text(f"{json.dumps(payload, indent=2)}\n", encoding="utf-8")
+    os.replace(tmp_file, state_file)
+
+
+class StateWriter:
+    """Coalesce backfill state writes to at most one per `min_interval_s`.
+
+    Non-running statuses (paused/completed) are always written immediately.
+    """
+
+    def __init__(
+        self,
+        state_file: Path,
+        *,
+        start_month: str,
+        end_month: str,
+        total_months: int,
+        min_interval_s: float = 1.0,
+    ) -> None:
+        self.state_file = state_file
+        self.start_month = start_month
+        self.end_month = end_month
+        self.total_months = total_months
+        self.min_interval_s = min_interval_s
+        self.last_write_monotonic = float("-inf")
+        self.pending_payload: dict[str, object] | None = None
+
+    def update(
+        self,
+        *,
+        status: str,
+        completed_months: int,
+        current_month: str | None,
+        next_month: str | None,
+        elapsed_seconds: float,
+        now_iso: str | None = None,
+    ) -> None:
+        self.pending_payload = {
+            "status": status,
+            "completed_months": completed_months,
+            "current_month": current_month,
+            "next_month": next_month,
+            "elapsed_seconds": elapsed_seconds,
+            "now_iso": now_iso,
+        }
+        self.flush(force=status != "running")
+
+    def flush(self, force: bool = False) -> None:
+        if self.pending_payload is None:
+            return
+        now = time.monotonic()
+        if not force and now - self.last_write_monotonic < self.min_interval_s:
+            return
+        write_backfill_state(
+            self.state_file,
+            start_month=self.start_month,
+            end_month=self.end_month,
+            total_months=self.total_months,
+            **self.pending_payload,
+        )
+        self.pending_payload = None
+        self.last_write_monotonic = now
 
 
 def benchmark_config(
-    pairs: list[tuple[float, float, float, float]],
+    batches: list[list[tuple[float, float, float, float]]],
     osrm_url: str,
     workers: int,
     qps: float,
     timeout: int,
 ) -> dict[str, float]:
     limiter = bike_pipeline.RateLimiter(qps)
-    session_local = threading.local()
-
-    def get_session():
-        session = getattr(session_local, "session", None)
-        if session is None:
-            session = bike_pipeline.build_http_session()
-            session_local.session = session
-        return session
+    # One keep-alive pool sized to the worker count, shared by every worker thread.
+    session = bike_pipeline.build_http_session(pool_maxsize=workers)
 
     started = time.monotonic()
     success = 0
     failure = 0
 
-    def run_pair(pair: tuple[float, float, float, float]) -> bool:
-        start_lon, start_lat, end_lon, end_lat = pair
+    def run_batch(batch: list[tuple[float, float, float, float]]) -> bool:
         limiter.wait()
         try:
-            bike_pipeline.fetch_osrm_route(
-                session=get_session(),
+            bike_pipeline.fetch_osrm_routes_batch(
+                session=session,
                 osrm_base_url=osrm_url,
-                start_lon=start_lon,
-                start_lat=start_lat,
-                end_lon=end_lon,
-                end_lat=end_lat,
+                pairs=batch,
                 timeout=timeout,
             )
             return True
         except Exception:  # noqa: BLE001
             return False
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
-        for ok in pool.map(run_pair, pairs):
-            if ok:
-                success += 1
-            else:
-                failure += 1
+    # Keep at most workers * 2 probes in flight and bail out once a config is clearly failing.
+    pending_batches = iter(batches)
+    inflight: set[concurrent.futures.Future[bool]] = set()
+    early_check_after = max(1, len(batches) // 4)
+    rejected = False
+    with session, concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while len(inflight) < workers * 2:
+                batch = next(pending_batches, None)
+                if batch is None:
+                    break
+                inflight.add(pool.submit(run_batch, batch))
+            if not inflight:
+                break
+            done, inflight = concurrent.futures.wait(
+                inflight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.result():
+                    success += 1
+                else:
+                    failure += 1
+            total = success + failure
+            if total >= early_check_after and failure / total > EARLY_REJECT_FAILURE_RATE:
+                rejected = True
+                for future in inflight:
+                    future.cancel()
+                break
 
     elapsed = max(time.monotonic() - started, 1e-6)
     total = success + failure
@@ -368,9 +560,72 @@ def benchmark_config(
         "elapsed_s": float(elapsed),
         "success_rate": float(success_rate),
         "throughput_success_rps": float(throughput),
+        "rejected": float(rejected),
     }
 
 
+def rank_key(metrics: dict[str, float]) -> tuple[bool, bool, float]:
+    return (
+        metrics["success_rate"] >= 0.995,
+        not metrics["rejected"],
+        metrics["throughput_success_rps"],
+    )
+
+
+def successive_halving(
+    configs: list[tuple[int, float]],
+    batches: list[list[tuple[float, float, float, float]]],
+    args: argparse.Namespace,
+    rounds: int = 4,
+) -> list[dict[str, float]]:
+    """Benchmark configs on doubling probe budgets, keeping the better half each round.
+
+    The first budget is chosen so the final round runs every probe batch. Returns the
+    metrics of the configs that survived into the final round.
+    """
+    rng = random.Random(42)
+    budget = max(1, len(batches) >> (rounds - 1))
+    survivors = list(configs)
+    results: list[dict[str, float]] = []
+    for round_index in range(1, rounds + 1):
+        probe = rng.sample(batches, k=min(budget, len(batches)))
+        results = []
+        for workers, qps in survivors:
+            metrics = benchmark_config(
+                batches=probe,
+                osrm_url=args.osrm_url,
+                workers=workers,
+                qps=qps,
+                timeout=args.request_timeout,
+            )
+            results.append(metrics)
+            LOGGER.info(
+                "Auto-tune probe workers=%d qps=%.1f -> success %.1f%%, throughput %.1f rps%s",
+                workers,
+                qps,
+                metrics["success_rate"] * 100.0,
+                metrics["throughput_success_rps"],
+                " (rejected early)" if metrics["rejected"] else "",
+            )
+        results.sort(key=rank_key, reverse=True)
+        LOGGER.info(
+            "Auto-tune round %d/%d: %d config(s) x %d request(s); best workers=%d qps=%.1f",
+            round_index,
+            rounds,
+            len(survivors),
+            len(probe),
+            int(results[0]["workers"]),
+            results[0]["qps"],
+        )
+        if round_index == rounds or len(results) == 1:
+            break
+        survivors = [
+            (int(row["workers"]), float(row["qps"])) for row in results[: max(1, len(results) // 2)]
+        ]
+        budget *= 2
+    return results
+
+
 def auto_tune_osrm(args: argparse.Namespace) -> tuple[int, float]:
     cpu_count = os.cpu_count() or 8
     worker_candidates = sorted(
@@ -395,33 +650,19 @@ def auto_tune_osrm(args: argparse.Namespace) -> tuple[int, float]:
     probe_target = max(40, args.auto_tune_requests)
     pairs = load_probe_pairs(Path(args.route_cache), limit=probe_target)
     random.Random(42).shuffle(pairs)
-    pairs = expand_probe_pairs(pairs, args.auto_tune_requests)
+    # --auto-tune-requests budgets routed pairs, so batching keeps the load on
+    # the OSRM server what it was with single-route probes.
+    batch_count = max(1, -(-args.auto_tune_requests // bike_pipeline.OSRM_BATCH_SIZE))
+    batches = build_probe_batches(pairs, batch_count)
 
     LOGGER.info(
-        "Auto-tune: benchmarking %d requests across %d worker levels x %d qps levels.",
-        len(pairs),
+        "Auto-tune: successive halving over %d worker levels x %d qps levels (up to %d batched requests).",
         len(worker_candidates),
         len(qps_candidates),
+        len(batches),
     )
-
-    results: list[dict[str, float]] = []
-    for workers in worker_candidates:
-        for qps in qps_candidates:
-            metrics = benchmark_config(
-                pairs=pairs,
-                osrm_url=args.osrm_url,
-                workers=workers,
-                qps=qps,
-                timeout=args.request_timeout,
-            )
-            results.append(metrics)
-            LOGGER.info(
-                "Auto-tune probe workers=%d qps=%.1f -> success %.1f%%, throughput %.1f rps",
-                workers,
-                qps,
-                metrics["success_rate"] * 100.0,
-                metrics["throughput_success_rps"],
-            )
+    configs = [(workers, qps) for workers in worker_candidates for qps in qps_candidates]
+    results = successive_halving(configs, batches, args)
 
     acceptable = [row for row in results if row["success_rate"] >= 0.995]
     chosen_pool = acceptable if acceptable else results
@@ -443,15 +684,66 @@ def auto_tune_osrm(args: argparse.Namespace) -> tuple[int, float]:
     return chosen_workers, chosen_qps
 
 
-def main() -> None:
-    args = parse_args()
+def parquet_zstd_level(metadata: Mapping[bytes, bytes]) -> int | None:
+    """Return the zstd level recorded in a day file's schema metadata, if any."""
+    level = metadata.get(bike_pipeline.DAILY_ZSTD_LEVEL_METADATA_KEY)
+    if level is not None:
+        return int(level)
+    if LEGACY_RECOMPRESSED_METADATA_KEY in metadata:
+        return LEGACY_RECOMPRESSED_LEVEL
+    return None
+
+
+def recompress_parquet_file(path: Path, compression_level: int) -> bool:
+    """Rewrite one day file at compression_level; returns False if it is already there."""
+    metadata = pq.read_schema(path).metadata or {}
+    current_level = parquet_zstd_level(metadata)
+    if current_level is not None and current_level >= compression_level:
+        return False
+    table = pq.read_table(path)
+    table_metadata = dict(table.schema.metadata or {})
+    table_metadata.pop(LEGACY_RECOMPRESSED_METADATA_KEY, None)
+    table_metadata[bike_pipeline.DAILY_ZSTD_LEVEL_METADATA_KEY] = str(compression_level).encode()
+    table = table.replace_schema_metadata(table_metadata)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    pq.write_table(
+        table,
+        tmp_path,
+        row_group_size=bike_pipeline.DAILY_ROW_GROUP_ROWS,
+        **bike_pipeline.daily_parquet_write_options(compression_level),
+    )
+    os.replace(tmp_path, path)
+    return True
+
+
+def configure_logging(verbose: bool) -> None:
     logging.basicConfig(
-        level=logging.DEBUG if args.verbose else logging.INFO,
+        level=logging.DEBUG if verbose else logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
 
+
+def _process_one_month(job: bike_pipeline.MonthJob) -> float:
+    """Process one month in a pool worker and return its wall-clock duration."""
+    started_at = time.monotonic()
+    bike_pipeline.process_month(job)
+    return time.monotonic() - started_at
+
+
+def _next_pending_month(months: Sequence[str], done: set[str]) -> str | None:
+    return next((month for month in months if month not in done), None)
+
+
+def main() -> None:
+    args = parse_args()
+    configure_logging(args.verbose)
+
     resolved_end_month = (
-        discover_latest_available_month(args.tfl_base_url, args.start_month)
+        discover_latest_available_month(
+            args.tfl_base_url,
+            args.start_month,
+            listing_cache_path=Path(args.download_dir) / bike_pipeline.DISCOVERY_CACHE_NAME,
+        )
         if args.end_month == "latest"
         else args.end_month
     )
@@ -471,9 +763,13 @@ def main() -> None:
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     pause_file = Path(args.pause_file)
-    state_file = Path(args.state_file)
+    pause_requested = threading.Event()
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda *_: pause_requested.set())
     overall_started_at = time.monotonic()
     completed_months = 0
+    done_months: set[str] = set()
+    existing_months = list_output_months(output_dir) if args.resume else set()
 
     LOGGER.info(
         "Backfill plan: %s -> %s (%d month(s))",
@@ -481,12 +777,14 @@ def main() -> None:
         resolved_end_month,
         len(months),
     )
-    write_backfill_state(
-        state_file=state_file,
-        status="running",
+    state_writer = StateWriter(
+        Path(args.state_file),
         start_month=args.start_month,
         end_month=resolved_end_month,
         total_months=len(months),
+    )
+    state_writer.update(
+        status="running",
         completed_months=completed_months,
         current_month=None,
         next_month=months[0] if months else None,
@@ -494,104 +792,146 @@ def main() -> None:
     )
 
     paused = False
-    for index, month in enumerate(months, start=1):
-        if args.resume and month_has_output(month, output_dir):
-            LOGGER.info("[%d/%d] Skipping %s (output already exists).", index, len(months), month)
-            completed_months += 1
-            log_overall_progress(
-                completed=completed_months,
-                total=len(months),
-                overall_started_at=overall_started_at,
-                current_month=month,
-            )
-            write_backfill_state(
-                state_file=state_file,
-                status="running",
-                start_month=args.start_month,
-                end_month=resolved_end_month,
-                total_months=len(months),
-                completed_months=completed_months,
-                current_month=month,
-                next_month=months[index] if index < len(months) else None,
-                elapsed_seconds=time.monotonic() - overall_started_at,
+    skipped_months = (
+        [month for month in months if month in existing_months]
+        if args.resume
+        else []
+    )
+    done_months.update(skipped_months)
+    pending_months = [month for month in months if month not in done_months]
+    if skipped_months:
+        tick = time.monotonic()
+        now_iso = datetime.now(timezone.utc).isoformat()
+        completed_months += len(skipped_months)
+        LOGGER.info(
+            "Skipping %d/%d month(s) with existing output (%s .. %s).",
+            len(skipped_months),
+            len(months),
+            skipped_months[0],
+            skipped_months[-1],
+        )
+        log_overall_progress(
+            completed=completed_months,
+            total=len(months),
+            overall_started_at=overall_started_at,
+            current_month=skipped_months[-1],
+            now=tick,
+        )
+        state_writer.update(
+            status="running",
+            completed_months=completed_months,
+            current_month=skipped_months[-1],
+            next_month=_next_pending_month(months, done_months),
+            elapsed_seconds=tick - overall_started_at,
+            now_iso=now_iso,
+        )
+        if pause_requested.is_set() or pause_file.exists():
+            paused = True
+            LOGGER.warning(
+                "Pause requested (%s or SIGUSR1). Stopping cleanly after skipping completed months.",
+                pause_file,
             )
-            if pause_file.exists():
-                paused = True
-                LOGGER.warning(
-                    "Pause file detected (%s). Stopping cleanly after month %s.",
-                    pause_file,
-                    month,
-                )
-            continue
 
-        if paused:
-            break
-
-        LOGGER.info("[%d/%d] Processing %s", index, len(months), month)
-        month_started_at = time.monotonic()
-        month_args = argparse.Namespace(
-            month=month,
+    if pending_months and not paused:
+        month_workers = max(1, min(args.month_workers or os.cpu_count() or 1, len(pending_months)))
+        # OSRM limits are global, so split them (and CPUs for CSV ingest) across
+        # concurrently running months.
+        base_job = bike_pipeline.MonthJob(
+            month="",
             tfl_base_url=args.tfl_base_url,
             osrm_url=args.osrm_url,
             download_dir=args.download_dir,
             extract_dir=args.extract_dir,
             output_dir=args.output_dir,
             route_cache=args.route_cache,
-            osrm_workers=args.osrm_workers,
-            osrm_qps=args.osrm_qps,
+            osrm_workers=max(1, args.osrm_workers // month_workers),
+            osrm_qps=args.osrm_qps / month_workers,
             request_timeout=args.request_timeout,
             max_trips=args.max_trips,
             max_trips_strategy=args.max_trips_strategy,
             max_trips_seed=args.max_trips_seed,
             max_new_routes=args.max_new_routes,
             verbose=args.verbose,
+            ingest_workers=max(1, (os.cpu_count() or 1) // month_workers),
+            zstd_level=args.zstd_level,
+        )
+        jobs = [dataclasses.replace(base_job, month=month) for month in pending_months]
+        LOGGER.info(
+            "Processing %d month(s) with %d worker process(es).",
+            len(pending_months),
+            month_workers,
         )
 
+        # Submit one month per free worker so a pause never strands already-queued months.
+        pending_jobs = iter(jobs)
+        inflight: dict[concurrent.futures.Future[float], str] = {}
         try:
-            bike_pipeline.process_month(month_args)
-            month_elapsed = time.monotonic() - month_started_at
-            LOGGER.info("Month %s completed in %.1f minutes.", month, month_elapsed / 60.0)
-            completed_months += 1
-            log_overall_progress(
-                completed=completed_months,
-                total=len(months),
-                overall_started_at=overall_started_at,
-                current_month=month,
-            )
-            write_backfill_state(
-                state_file=state_file,
-                status="running",
-                start_month=args.start_month,
-                end_month=resolved_end_month,
-                total_months=len(months),
-                completed_months=completed_months,
-                current_month=month,
-                next_month=months[index] if index < len(months) else None,
-                elapsed_seconds=time.monotonic() - overall_started_at,
-            )
-            if pause_file.exists():
-                paused = True
-                LOGGER.warning(
-                    "Pause file detected (%s). Stopping cleanly after month %s.",
-                    pause_file,
-                    month,
-                )
-                break
-        except Exception as exc:  # noqa: BLE001
-            LOGGER.exception("Month %s failed: %s", month, exc)
-            if not args.continue_on_error:
-                raise
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=month_workers,
+                initializer=configure_logging,
+                initargs=(args.verbose,),
+            ) as pool:
+                while True:
+                    while not paused and len(inflight) < month_workers:
+                        job = next(pending_jobs, None)
+                        if job is None:
+                            break
+                        inflight[pool.submit(_process_one_month, job)] = job.month
+                    if not inflight:
+                        break
+                    # A month can take an hour; publish any coalesced update before blocking.
+                    state_writer.flush(force=True)
+                    done, _ = concurrent.futures.wait(
+                        inflight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        month = inflight.pop(future)
+                        try:
+                            month_elapsed = future.result()
+                        except Exception as exc:  # noqa: BLE001
+                            LOGGER.exception("Month %s failed: %s", month, exc)
+                            if not args.continue_on_error:
+                                raise
+                            continue
+
+                        tick = time.monotonic()
+                        now_iso = datetime.now(timezone.utc).isoformat()
+                        LOGGER.info(
+                            "Month %s completed in %.1f minutes.", month, month_elapsed / 60.0
+                        )
+                        completed_months += 1
+                        done_months.add(month)
+                        log_overall_progress(
+                            completed=completed_months,
+                            total=len(months),
+                            overall_started_at=overall_started_at,
+                            current_month=month,
+                            now=tick,
+                        )
+                        state_writer.update(
+                            status="running",
+                            completed_months=completed_months,
+                            current_month=month,
+                            next_month=_next_pending_month(months, done_months),
+                            elapsed_seconds=tick - overall_started_at,
+                            now_iso=now_iso,
+                        )
+                    if not paused and (pause_requested.is_set() or pause_file.exists()):
+                        paused = True
+                        LOGGER.warning(
+                            "Pause requested (%s or SIGUSR1). Stopping cleanly after in-flight months finish.",
+                            pause_file,
+                        )
+        finally:
+            # Coalesced per-month updates must reach disk even if a month raises.
+            state_writer.flush(force=True)
 
     if paused:
-        write_backfill_state(
-            state_file=state_file,
+        state_writer.update(
             status="paused",
-            start_month=args.start_month,
-            end_month=resolved_end_month,
-            total_months=len(months),
             completed_months=completed_months,
             current_month=None,
-            next_month=months[completed_months] if completed_months < len(months) else None,
+            next_month=_next_pending_month(months, done_months),
             elapsed_seconds=time.monotonic() - overall_started_at,
         )
         LOGGER.warning(
@@ -601,12 +941,22 @@ def main() -> None:
         return
 
     dataset_files = bike_pipeline.list_dataset_parquet_files(output_dir)
-    write_backfill_state(
-        state_file=state_file,
+    if args.recompress_on_complete and dataset_files:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+            rewritten = sum(
+                pool.map(
+                    functools.partial(recompress_parquet_file, compression_level=args.zstd_level),
+                    dataset_files,
+                )
+            )
+        LOGGER.info(
+            "Recompressed %d/%d parquet day file(s) with zstd level %d.",
+            rewritten,
+            len(dataset_files),
+            args.zstd_level,
+        )
+    state_writer.update(
         status="completed",
-        start_month=args.start_month,
-        end_month=resolved_end_month,
-        total_months=len(months),
         completed_months=completed_months,
         current_month=None,
         next_month=None,
@@ -11,10 +11,21 @@ Pipeline steps:
 from __future__ import annotations
 
 import argparse
+import bisect
 import concurrent.futures
+import contextlib
+import csv
+import functools
+import itertools
 import json
 import logging
+import math
+import operator
+import os
 import re
+import shutil
+import struct
+import tempfile
 import threading
 import time
 import warnings
@@ -22,23 +33,50 @@ import zipfile
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Mapping, Sequence
 from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlparse, urlsplit, urlunsplit
 
+import numpy as np
 import pandas as pd
-import polyline
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock.
+    fcntl = None
+
+# pandas 3 always copies on write. On 2.x, opt in so that column selections, masks
+# and assign() share buffers until written instead of copying every block. Set at
+# import so CSV ingest worker processes get it too.
+if int(pd.__version__.split(".", 1)[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 LOGGER = logging.getLogger("london-bike-pipeline")
 LONDON_LAT_MIN = 51.20
 LONDON_LAT_MAX = 51.75
 LONDON_LON_MIN = -0.60
 LONDON_LON_MAX = 0.35
+OSRM_BATCH_SIZE = 25
+OSRM_IN_FLIGHT_PER_WORKER = 2
+OSRM_CHECKPOINT_ROUTES = 10_000
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_CHUNK_BYTES = 8 << 20
+DISCOVERY_CACHE_TTL_S = 86_400
+# Written under --download-dir; shared by single-month runs and backfill discovery.
+DISCOVERY_CACHE_NAME = ".tfl_discovery_cache.json"
+# Day files are written once and downloaded by every client, so favour size.
+DAILY_ZSTD_LEVEL = 10
+# Station names repeat across millions of rows; keep one copy per name.
+STATION_DTYPE = pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))
 
 COLUMN_ALIASES = {
     "trip_id": [
@@ -128,27 +166,104 @@ class RouteResult:
     route_source: str
 
 
+ROUTE_CACHE_COLUMNS = tuple(RouteResult.__dataclass_fields__)
+ROUTE_CACHE_ROW_GROUP_ROWS = 50_000
+ROUTE_CACHE_DTYPES = {
+    "start_lon": "float64",
+    "start_lat": "float64",
+    "end_lon": "float64",
+    "end_lat": "float64",
+    "route_geometry": "string",
+    "route_distance_m": "float64",
+    "route_duration_s": "float64",
+    "route_source": "string",
+}
+_route_result_fields = operator.attrgetter(*ROUTE_CACHE_COLUMNS)
+
+
+@dataclass(frozen=True, slots=True)
+class MonthJob:
+    """Picklable per-month settings; attribute-compatible with the CLI namespace."""
+
+    month: str
+    tfl_base_url: str
+    osrm_url: str
+    download_dir: str
+    extract_dir: str
+    output_dir: str
+    route_cache: str
+    osrm_workers: int
+    osrm_qps: float
+    request_timeout: int
+    max_trips: int | None
+    max_trips_strategy: str
+    max_trips_seed: int
+    max_new_routes: int | None
+    verbose: bool
+    ingest_workers: int | None = None
+    zstd_level: int = DAILY_ZSTD_LEVEL
+
+
 class RateLimiter:
-    """Token-like limiter that enforces max requests per second globally."""
+    """Token-like limiter that enforces max requests per second globally.
+
+    Up to ``burst`` calls may go through back-to-back after the limiter has been
+    idle; sustained throughput is still ``qps``.
+    """
 
-    def __init__(self, qps: float) -> None:
+    def __init__(self, qps: float, burst: int = 1) -> None:
         if qps <= 0:
             raise ValueError("qps must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
         self.interval = 1.0 / qps
-        self._lock = threading.Lock()
-        self._next_ts = 0.0
+        self._interval_ns = max(1, int(1e9 / qps))
+        # How far in the past a slot may lie before the limiter counts as idle.
+        self._slack_ns = (burst - 1) * self._interval_ns
+        self._tickets = itertools.count()
+        self._epoch_ns = time.monotonic_ns() - self._slack_ns
+        self._anchor_lock = threading.Lock()
 
     def wait(self) -> None:
-        with self._lock:
-            now = time.monotonic()
-            if now < self._next_ts:
-                time.sleep(self._next_ts - now)
-                now = time.monotonic()
-            self._next_ts = max(self._next_ts, now) + self.interval
+        # next() on itertools.count is atomic under the GIL, so each caller gets a
+        # unique slot without taking a lock on the common path.
+        ticket = next(self._tickets)
+        delay_ns = self._epoch_ns + ticket * self._interval_ns - time.monotonic_ns()
+        if delay_ns < -self._slack_ns:
+            # Slot is further in the past than the burst allowance (limiter sat
+            # idle): re-anchor so this call starts a fresh burst and later tickets
+            # are spaced from here instead of firing all at once.
+            # The lock makes check-and-re-anchor atomic, so a thread holding the next
+            # ticket sees the new epoch and waits instead of re-anchoring again.
+            with self._anchor_lock:
+                now_ns = time.monotonic_ns()
+                delay_ns = self._epoch_ns + ticket * self._interval_ns - now_ns
+                if delay_ns < -self._slack_ns:
+                    self._epoch_ns = now_ns - ticket * self._interval_ns - self._slack_ns
+        if delay_ns > 0:
+            time.sleep(delay_ns / 1e9)
+
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+_WHITESPACE_RUN = re.compile(r"\s+")
+_DAY_PARQUET_NAME = re.compile(r"\d{4}-\d{2}-\d{2}\.parquet$")
+_TRAILING_DIGITS = re.compile(r"(\d+)$")
+# Deletes every ASCII character outside [a-z0-9]; used after lower().
+_NON_ALNUM_ASCII = str.maketrans(
+    "", "", "".join(chr(code) for code in range(128) if _NON_ALNUM.match(chr(code)))
+)
 
 
 def normalize_text(value: str) -> str:
-    return re.sub(r"[^a-z0-9]", "", value.lower())
+    lowered = value.lower()
+    if lowered.isascii():
+        return lowered.translate(_NON_ALNUM_ASCII)
+    return _NON_ALNUM.sub("", lowered)
+
+
+NORMALIZED_COLUMN_ALIASES = {
+    key: [normalize_text(alias) for alias in aliases] for key, aliases in COLUMN_ALIASES.items()
+}
 
 
 def normalize_station_name(name: object) -> str:
@@ -156,13 +271,27 @@ def normalize_station_name(name: object) -> str:
         return "Unknown"
     clean = str(name).strip()
     clean = clean.replace("’", "'").replace("&amp;", "&")
-    clean = re.sub(r"\s+", " ", clean)
+    clean = _WHITESPACE_RUN.sub(" ", clean)
     if not clean:
         return "Unknown"
     titled = clean.title()
     return titled.replace("'S", "'s")
 
 
+def normalize_station_name_series(names: pd.Series) -> pd.Series:
+    """Vectorized `normalize_station_name` for a whole column."""
+    clean = (
+        names.astype("string")
+        .str.strip()
+        .str.replace("’", "'", regex=False)
+        .str.replace("&amp;", "&", regex=False)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.title()
+        .str.replace("'S", "'s", regex=False)
+    )
+    return clean.mask(clean.isna() | (clean == ""), "Unknown")
+
+
 def parse_month(month_str: str) -> tuple[datetime, datetime]:
     month_start = datetime.strptime(month_str, "%Y-%m").replace(tzinfo=timezone.utc)
     if month_start.month == 12:
@@ -181,11 +310,18 @@ def cap_trips(
         return trips
 
     if strategy == "earliest":
-        capped = trips.head(max_trips).copy()
+        capped = trips.head(max_trips)
     else:
-        capped = trips.sample(n=max_trips, random_state=seed).sort_values("start_time").copy()
-
-    day_count = capped["start_time"].dt.date.nunique()
+        # Sample positions, not rows: the same draw trips.sample(random_state=seed)
+        # makes, materialized once with iloc. Sorted positions keep the caller's
+        # (start_time-sorted) order, so a sort is only needed for unsorted input.
+        positions = np.random.RandomState(seed).choice(len(trips), size=max_trips, replace=False)
+        positions.sort()
+        capped = trips.iloc[positions]
+        if not capped["start_time"].is_monotonic_increasing:
+            capped = capped.sort_values("start_time", kind="stable")
+
+    day_count = capped["start_time"].dt.floor("D").nunique()
     LOGGER.warning(
         "Trimmed dataset to %d trips via --max-trips using '%s' strategy (%d unique days retained).",
         len(capped),
@@ -197,7 +333,7 @@ def cap_trips(
 
 def list_dataset_parquet_files(parquet_dir: Path) -> list[Path]:
     return sorted(
-        [path for path in parquet_dir.glob("*.parquet") if re.match(r"\d{4}-\d{2}-\d{2}\.parquet$", path.name)]
+        [path for path in parquet_dir.glob("*.parquet") if _DAY_PARQUET_NAME.match(path.name)]
     )
 
 
@@ -224,11 +360,14 @@ def write_dataset_manifest(
         "created_at_utc": datetime.now(timezone.utc).isoformat(),
     }
     metadata_path = parquet_dir / "manifest.json"
-    metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    # Months finishing together share the manifest; never leave it half-written.
+    tmp_path = metadata_path.with_name(f"{metadata_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    os.replace(tmp_path, metadata_path)
     return metadata_path
 
 
-def build_http_session() -> requests.Session:
+def build_http_session(pool_maxsize: int = 10) -> requests.Session:
     retry = Retry(
         total=4,
         connect=4,
@@ -237,23 +376,30 @@ def build_http_session() -> requests.Session:
         status_forcelist=(429, 500, 502, 503, 504),
         allowed_methods=("GET",),
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(
+        max_retries=retry, pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+    )
     session = requests.Session()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
-    session.headers.update({"User-Agent": "london-bike-pipeline/1.0"})
+    session.headers.update({"User-Agent": "london-bike-pipeline/1.0", "Connection": "keep-alive"})
     return session
 
 
+DATE_RANGE_PATTERNS = [
+    (re.compile(r"(\d{1,2}[A-Za-z]{3}\d{4})-(\d{1,2}[A-Za-z]{3}\d{4})"), "%d%b%Y"),
+    (re.compile(r"(\d{1,2}[A-Za-z]{3}\d{2})-(\d{1,2}[A-Za-z]{3}\d{2})"), "%d%b%y"),
+    (re.compile(r"(\d{8})-(\d{8})"), "%Y%m%d"),
+]
+
+
 def extract_date_ranges(text: str) -> list[tuple[datetime, datetime]]:
-    patterns = [
-        (r"(\d{1,2}[A-Za-z]{3}\d{4})-(\d{1,2}[A-Za-z]{3}\d{4})", "%d%b%Y"),
-        (r"(\d{1,2}[A-Za-z]{3}\d{2})-(\d{1,2}[A-Za-z]{3}\d{2})", "%d%b%y"),
-        (r"(\d{8})-(\d{8})", "%Y%m%d"),
-    ]
     ranges: list[tuple[datetime, datetime]] = []
-    for pattern, fmt in patterns:
-        for start_text, end_text in re.findall(pattern, text):
+    if "-" not in text:
+        return ranges
+    for pattern, fmt in DATE_RANGE_PATTERNS:
+        for match in pattern.finditer(text):
+            start_text, end_text = match.groups()
             try:
                 start = datetime.strptime(start_text, fmt).replace(tzinfo=timezone.utc)
                 end = datetime.strptime(end_text, fmt).replace(tzinfo=timezone.utc)
@@ -271,9 +417,28 @@ def overlaps(
     return range_start < month_end and range_end > month_start
 
 
-def discover_month_urls(
-    session: requests.Session, base_url: str, month_start: datetime, month_end: datetime
-) -> list[str]:
+class _AnchorHrefParser(HTMLParser):
+    """Collect <a href> values; the parser also unescapes entities such as &amp;."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hrefs: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "a":
+            self.hrefs.extend(value for name, value in attrs if name == "href" and value)
+
+
+def extract_anchor_hrefs(html_text: str) -> list[str]:
+    parser = _AnchorHrefParser()
+    parser.feed(html_text)
+    parser.close()
+    return parser.hrefs
+
+
+def list_source_urls(session: requests.Session, base_url: str) -> set[str]:
+    """Return every CSV/ZIP URL published under the TfL listing (all months)."""
+
     def parse_s3_listing(listing_url: str) -> tuple[str, set[str]]:
         """Read all S3 listing pages and return bucket host + file URLs."""
 
@@ -336,24 +501,84 @@ def discover_month_urls(
             "TfL usage-stats path returned 404; falling back to S3 listing endpoint: %s",
             fallback_url,
         )
-        return discover_month_urls(
-            session=session,
-            base_url=fallback_url,
-            month_start=month_start,
-            month_end=month_end,
-        )
+        return list_source_urls(session=session, base_url=fallback_url)
     response.raise_for_status()
 
     all_candidates: set[str] = set()
     if "<ListBucketResult" in response.text:
         _, all_candidates = parse_s3_listing(base_url)
     else:
-        hrefs = re.findall(r"""href=["']([^"']+)["']""", response.text, flags=re.IGNORECASE)
-        for href in hrefs:
+        for href in extract_anchor_hrefs(response.text):
             lower = href.lower()
             if not lower.endswith(".csv") and not lower.endswith(".zip"):
                 continue
             all_candidates.add(urljoin(base_url, href))
+    return all_candidates
+
+
+def load_discovery_cache(
+    cache_path: Path, base_url: str
+) -> list[tuple[str, list[tuple[datetime, datetime]]]] | None:
+    """Return cached (url, date ranges) entries for base_url if younger than the TTL."""
+    try:
+        entry = json.loads(cache_path.read_text(encoding="utf-8")).get(base_url)
+    except (FileNotFoundError, ValueError):
+        return None
+    if not entry or time.time() - float(entry.get("fetched_at", 0.0)) >= DISCOVERY_CACHE_TTL_S:
+        return None
+    return [
+        (
+            item["url"],
+            [(datetime.fromisoformat(start), datetime.fromisoformat(end)) for start, end in item["ranges"]],
+        )
+        for item in entry.get("entries", [])
+    ]
+
+
+def save_discovery_cache(
+    cache_path: Path, base_url: str, entries: Sequence[tuple[str, list[tuple[datetime, datetime]]]]
+) -> None:
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        cache = {}
+    cache[base_url] = {
+        "fetched_at": time.time(),
+        "entries": [
+            {"url": url, "ranges": [[start.isoformat(), end.isoformat()] for start, end in ranges]}
+            for url, ranges in entries
+        ],
+    }
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Per-process tmp name: backfill months may refresh the cache concurrently.
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+class NoMonthFilesError(RuntimeError):
+    """The TfL listing was read but has no files for the requested month."""
+
+
+def discover_month_urls(
+    session: requests.Session,
+    base_url: str,
+    month_start: datetime,
+    month_end: datetime,
+    listing_cache_path: Path | None = None,
+) -> list[str]:
+    entries = None
+    if listing_cache_path is not None:
+        entries = load_discovery_cache(listing_cache_path, base_url)
+        if entries is not None:
+            LOGGER.info("Reusing cached TfL listing for %s (%d files)", base_url, len(entries))
+    if entries is None:
+        entries = [
+            (url, extract_date_ranges(Path(urlparse(url).path).name))
+            for url in sorted(list_source_urls(session=session, base_url=base_url))
+        ]
+        if listing_cache_path is not None:
+            save_discovery_cache(listing_cache_path, base_url, entries)
 
     month_tokens = {
         month_start.strftime("%Y%m"),
@@ -364,20 +589,18 @@ def discover_month_urls(
     }
 
     selected: list[str] = []
-    for url in sorted(all_candidates):
-        filename = Path(urlparse(url).path).name
-        name_lower = filename.lower()
-        ranges = extract_date_ranges(filename)
+    for url, ranges in entries:
         if ranges:
             if any(overlaps(rs, re_, month_start, month_end) for rs, re_ in ranges):
                 selected.append(url)
             continue
 
+        name_lower = Path(urlparse(url).path).name.lower()
         if any(token in name_lower for token in month_tokens):
             selected.append(url)
 
     if not selected:
-        raise RuntimeError(
+        raise NoMonthFilesError(
             "No TfL CSV/ZIP files discovered for the requested month. "
             "Check --month and --tfl-base-url."
         )
@@ -386,27 +609,70 @@ def discover_month_urls(
     return selected
 
 
+@contextlib.contextmanager
+def path_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive flock on ``<path>.lock`` (months run in parallel processes)."""
+    if fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = path.with_name(f"{path.name}.lock")
+    with lock_path.open("a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 def download_files(
     session: requests.Session, urls: Sequence[str], download_dir: Path
 ) -> list[Path]:
     download_dir.mkdir(parents=True, exist_ok=True)
-    artifacts: list[Path] = []
-    for url in urls:
-        filename = Path(urlparse(url).path).name
-        target = download_dir / filename
-        if target.exists() and target.stat().st_size > 0:
-            LOGGER.info("Reusing download: %s", target.name)
-            artifacts.append(target)
-            continue
+    artifacts = [download_dir / Path(urlparse(url).path).name for url in urls]
 
-        LOGGER.info("Downloading: %s", url)
-        with session.get(url, timeout=90, stream=True) as response:
+    def remote_size(url: str) -> int | None:
+        try:
+            response = session.head(url, timeout=30, allow_redirects=True)
             response.raise_for_status()
-            with target.open("wb") as output:
-                for chunk in response.iter_content(chunk_size=1024 * 1024):
-                    if chunk:
-                        output.write(chunk)
-        artifacts.append(target)
+        except requests.RequestException:
+            return None
+        length = response.headers.get("Content-Length", "")
+        # A content-encoded length is not the size of the decoded file on disk.
+        if "Content-Encoding" in response.headers or not length.isdigit():
+            return None
+        return int(length)
+
+    def download(url: str, target: Path) -> None:
+        # Weekly files spanning two months are wanted by two month processes at
+        # once; the lock makes the second one wait and then reuse the file.
+        with path_lock(target):
+            if target.exists() and target.stat().st_size > 0:
+                # Reuse unless the server reports a different size (e.g. a re-published file).
+                expected = remote_size(url)
+                if expected is None or expected == target.stat().st_size:
+                    LOGGER.info("Reusing download: %s", target.name)
+                    return
+                LOGGER.info("Size changed for %s; downloading again", target.name)
+            LOGGER.info("Downloading: %s", url)
+            part_path = target.with_name(f"{target.name}.{os.getpid()}.part")
+            try:
+                with session.get(url, timeout=90, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    with part_path.open("wb") as output:
+                        shutil.copyfileobj(response.raw, output, DOWNLOAD_CHUNK_BYTES)
+                # Only complete files get the final name, so nothing ever reuses a partial one.
+                os.replace(part_path, target)
+            finally:
+                part_path.unlink(missing_ok=True)
+
+    if artifacts:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(DOWNLOAD_WORKERS, len(artifacts))
+        ) as pool:
+            for future in [pool.submit(download, url, target) for url, target in zip(urls, artifacts)]:
+                future.result()
     return artifacts
 
 
@@ -421,23 +687,46 @@ def extract_csv_paths(artifacts: Sequence[Path], extract_dir: Path) -> list[Path
         if suffix != ".zip":
             continue
 
-        target_dir = extract_dir / artifact.stem
-        target_dir.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(artifact) as archive:
-            members = [name for name in archive.namelist() if name.lower().endswith(".csv")]
-            for member in members:
-                archive.extract(member, path=target_dir)
-                csv_paths.append(target_dir / member)
+        csv_paths.extend(extract_archive_csvs(artifact, extract_dir / artifact.stem))
     if not csv_paths:
         raise RuntimeError("No CSV files found in downloaded artifacts.")
     LOGGER.info("Prepared %d CSV files for ingestion", len(csv_paths))
     return csv_paths
 
 
-def find_column(columns: Iterable[str], aliases: Sequence[str], required: bool) -> str | None:
-    normalized_to_original = {normalize_text(col): col for col in columns}
-    alias_keys = [normalize_text(alias) for alias in aliases]
+def extract_archive_csvs(artifact: Path, target_dir: Path) -> list[Path]:
+    """Extract the CSV members of a ZIP into target_dir, reusing a complete earlier extract."""
+    with zipfile.ZipFile(artifact) as archive:
+        members = [info for info in archive.infolist() if info.filename.lower().endswith(".csv")]
+        paths = [target_dir / info.filename for info in members]
+        with path_lock(target_dir):
+            if all(
+                path.is_file() and path.stat().st_size == info.file_size
+                for path, info in zip(paths, members)
+            ):
+                return paths
+            # Extract beside the target and swap it in whole, so a concurrent
+            # reader never sees a half-written CSV.
+            staging_dir = Path(tempfile.mkdtemp(prefix=f".{target_dir.name}.", dir=target_dir.parent))
+            try:
+                for info in members:
+                    archive.extract(info, path=staging_dir)
+                shutil.rmtree(target_dir, ignore_errors=True)
+                os.replace(staging_dir, target_dir)
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+    return paths
+
+
+def normalized_column_map(columns: Iterable[str]) -> dict[str, str]:
+    """Map normalize_text(column) -> column, built once per header for find_column."""
+    return {normalize_text(col): col for col in columns}
+
 
+def find_column(
+    normalized_to_original: Mapping[str, str], alias_keys: Sequence[str], required: bool
+) -> str | None:
+    """Resolve a column from pre-normalized alias keys (see NORMALIZED_COLUMN_ALIASES)."""
     for alias_key in alias_keys:
         if alias_key in normalized_to_original:
             return normalized_to_original[alias_key]
@@ -447,79 +736,162 @@ def find_column(columns: Iterable[str], aliases: Sequence[str], required: bool)
             return original
 
     if required:
-        raise KeyError(f"Could not resolve required column aliases: {aliases}")
+        raise KeyError(f"Could not resolve required column aliases: {list(alias_keys)}")
     return None
 
 
+def read_csv_arrow(path: Path) -> pd.DataFrame:
+    """Read a trip CSV with Arrow's multi-threaded reader.
+
+    Datetime columns are pinned to strings so parse_datetime_pair stays the
+    single place that decides day-first vs ISO ordering.
+    """
+    with path.open(newline="", encoding="utf-8-sig") as handle:
+        header = normalized_column_map(next(csv.reader(handle), []))
+    column_types = {
+        column: pa.string()
+        for column in (
+            find_column(header, NORMALIZED_COLUMN_ALIASES["start_time"], required=False),
+            find_column(header, NORMALIZED_COLUMN_ALIASES["end_time"], required=False),
+        )
+        if column is not None
+    }
+    try:
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=64 << 20),
+            parse_options=pacsv.ParseOptions(delimiter=","),
+            convert_options=pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True),
+        )
+    except pa.ArrowInvalid as exc:
+        # Arrow rejects ragged rows and columns whose type changes between blocks;
+        # pandas skips the former (with a warning) and reads the latter as strings.
+        LOGGER.warning("Arrow CSV reader failed on %s (%s); falling back to pandas.", path.name, exc)
+        return pd.read_csv(
+            path,
+            dtype={column: pd.ArrowDtype(pa.string()) for column in column_types},
+            dtype_backend="pyarrow",
+            encoding="utf-8-sig",
+            low_memory=False,
+            on_bad_lines="warn",
+        )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+DATETIME_FORMAT_CANDIDATES = {
+    False: ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y %H:%M"),
+    True: ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"),
+}
+
+
 def parse_datetime_pair(
     start_values: pd.Series, end_values: pd.Series
 ) -> tuple[pd.Series, pd.Series, str]:
-    """Parse start/end datetimes using the strategy that preserves sane durations."""
-
-    def parse(values: pd.Series, *, dayfirst: bool) -> pd.Series:
+    """Parse start/end datetimes using the strategy that preserves sane durations.
+
+    Timestamps repeat heavily, so each distinct string is parsed once per
+    day-first ordering and expanded back onto the full columns. An explicit
+    format is only used when it parses every distinct value; otherwise the
+    inferred parse is used.
+    """
+    uniques = pd.Index(pd.unique(pd.concat([start_values, end_values], ignore_index=True).dropna()))
+
+    def parse_uniques(dayfirst: bool) -> tuple[pd.DatetimeIndex, str]:
+        for fmt in DATETIME_FORMAT_CANDIDATES[dayfirst]:
+            parsed = pd.DatetimeIndex(pd.to_datetime(uniques, format=fmt, errors="coerce", utc=True))
+            if parsed.notna().all():
+                return parsed, f" format={fmt}"
         with warnings.catch_warnings():
+            # Format-inference chatter; unparseable values become NaT and lose the score.
             warnings.filterwarnings(
-                "ignore",
-                message="Parsing dates in %Y-%m-%d %H:%M format when dayfirst=True was specified.*",
-                category=UserWarning,
+                "ignore", message="Parsing dates in .* format when dayfirst=.* was specified"
             )
-            return pd.to_datetime(values, errors="coerce", dayfirst=dayfirst, utc=True)
-
-    start_dayfirst_false = parse(start_values, dayfirst=False)
-    end_dayfirst_false = parse(end_values, dayfirst=False)
-    score_dayfirst_false = (
-        start_dayfirst_false.notna()
-        & end_dayfirst_false.notna()
-        & (end_dayfirst_false >= start_dayfirst_false)
-    ).sum()
-
-    start_dayfirst_true = parse(start_values, dayfirst=True)
-    end_dayfirst_true = parse(end_values, dayfirst=True)
-    score_dayfirst_true = (
-        start_dayfirst_true.notna()
-        & end_dayfirst_true.notna()
-        & (end_dayfirst_true >= start_dayfirst_true)
-    ).sum()
-
-    if score_dayfirst_true > score_dayfirst_false:
-        return start_dayfirst_true, end_dayfirst_true, "dayfirst=True"
-    return start_dayfirst_false, end_dayfirst_false, "dayfirst=False"
-
-
-def normalize_trip_frame(raw: pd.DataFrame, source_name: str) -> pd.DataFrame:
-    columns = list(raw.columns)
+            warnings.filterwarnings("ignore", message="Could not infer format")
+            parsed = pd.to_datetime(uniques, errors="coerce", dayfirst=dayfirst, utc=True)
+        return pd.DatetimeIndex(parsed), ""
+
+    start_positions = uniques.get_indexer(start_values)
+    end_positions = uniques.get_indexer(end_values)
+
+    def expand(parsed: pd.DatetimeIndex, positions: np.ndarray, index: pd.Index) -> pd.Series:
+        # Position -1 (missing value) becomes NaT.
+        return pd.Series(parsed.take(positions, allow_fill=True, fill_value=pd.NaT), index=index)
+
+    candidates = []
+    for dayfirst in (False, True):
+        parsed, fmt_label = parse_uniques(dayfirst)
+        start = expand(parsed, start_positions, start_values.index)
+        end = expand(parsed, end_positions, end_values.index)
+        pair_score = int((start.notna() & end.notna() & (end >= start)).sum())
+        # Ties are settled by the distinct values each ordering can read at all:
+        # a day above 12 only parses under the right one.
+        candidates.append(((pair_score, int(parsed.notna().sum())), dayfirst, start, end, fmt_label))
+
+    # max() keeps the first of equal candidates, so a full tie stays month-first as before.
+    _, dayfirst, start, end, fmt_label = max(candidates, key=lambda candidate: candidate[0])
+    return start, end, f"dayfirst={dayfirst}{fmt_label}"
+
+
+def normalize_trip_frame(
+    raw: pd.DataFrame,
+    source_name: str,
+    month_start: datetime | None = None,
+    month_end: datetime | None = None,
+) -> pd.DataFrame:
+    """Map a raw TfL CSV frame onto the pipeline's trip columns.
+
+    With month_start/month_end, rows starting outside [month_start, month_end)
+    are dropped right after datetime parsing, before the per-row string work.
+    """
+    columns = normalized_column_map(raw.columns)
     resolved = {
-        "trip_id": find_column(columns, COLUMN_ALIASES["trip_id"], required=False),
-        "start_time": find_column(columns, COLUMN_ALIASES["start_time"], required=True),
-        "end_time": find_column(columns, COLUMN_ALIASES["end_time"], required=True),
-        "start_station": find_column(columns, COLUMN_ALIASES["start_station"], required=True),
+        "trip_id": find_column(columns, NORMALIZED_COLUMN_ALIASES["trip_id"], required=False),
+        "start_time": find_column(columns, NORMALIZED_COLUMN_ALIASES["start_time"], required=True),
+        "end_time": find_column(columns, NORMALIZED_COLUMN_ALIASES["end_time"], required=True),
+        "start_station": find_column(columns, NORMALIZED_COLUMN_ALIASES["start_station"], required=True),
         "start_station_number": find_column(
-            columns, COLUMN_ALIASES["start_station_number"], required=False
+            columns, NORMALIZED_COLUMN_ALIASES["start_station_number"], required=False
         ),
-        "end_station": find_column(columns, COLUMN_ALIASES["end_station"], required=True),
+        "end_station": find_column(columns, NORMALIZED_COLUMN_ALIASES["end_station"], required=True),
         "end_station_number": find_column(
-            columns, COLUMN_ALIASES["end_station_number"], required=False
+            columns, NORMALIZED_COLUMN_ALIASES["end_station_number"], required=False
         ),
-        "start_lat": find_column(columns, COLUMN_ALIASES["start_lat"], required=False),
-        "start_lon": find_column(columns, COLUMN_ALIASES["start_lon"], required=False),
-        "end_lat": find_column(columns, COLUMN_ALIASES["end_lat"], required=False),
-        "end_lon": find_column(columns, COLUMN_ALIASES["end_lon"], required=False),
+        "start_lat": find_column(columns, NORMALIZED_COLUMN_ALIASES["start_lat"], required=False),
+        "start_lon": find_column(columns, NORMALIZED_COLUMN_ALIASES["start_lon"], required=False),
+        "end_lat": find_column(columns, NORMALIZED_COLUMN_ALIASES["end_lat"], required=False),
+        "end_lon": find_column(columns, NORMALIZED_COLUMN_ALIASES["end_lon"], required=False),
     }
 
-    frame = pd.DataFrame()
+    start_time, end_time, datetime_strategy = parse_datetime_pair(
+        raw[resolved["start_time"]],
+        raw[resolved["end_time"]],
+    )
+    LOGGER.debug("Datetime parse strategy for %s: %s", source_name, datetime_strategy)
+    # Drop unusable rows once, up front, so nothing below needs a filtered copy.
+    # NaT compares False, which also removes rows with unparseable timestamps.
+    keep = end_time >= start_time
+    if month_start is not None and month_end is not None:
+        # TfL weekly extracts straddle month boundaries; skip the other month's rows early.
+        keep &= (start_time >= month_start) & (start_time < month_end)
+    keep = keep.to_numpy()
+    raw = raw[keep]
+    start_time = start_time[keep]
+    end_time = end_time[keep]
+
+    frame = pd.DataFrame(index=raw.index)
     if resolved["trip_id"] is not None:
         frame["trip_id"] = raw[resolved["trip_id"]].astype("string")
     else:
         frame["trip_id"] = pd.Series(index=raw.index, dtype="string")
+    frame["start_time"] = start_time
+    frame["end_time"] = end_time
 
-    frame["start_time"], frame["end_time"], datetime_strategy = parse_datetime_pair(
-        raw[resolved["start_time"]],
-        raw[resolved["end_time"]],
+    frame["start_station"] = normalize_station_name_series(raw[resolved["start_station"]]).astype(
+        STATION_DTYPE
+    )
+    frame["end_station"] = normalize_station_name_series(raw[resolved["end_station"]]).astype(
+        STATION_DTYPE
     )
-    LOGGER.debug("Datetime parse strategy for %s: %s", source_name, datetime_strategy)
-
-    frame["start_station"] = raw[resolved["start_station"]].map(normalize_station_name)
-    frame["end_station"] = raw[resolved["end_station"]].map(normalize_station_name)
     if resolved["start_station_number"] is not None:
         frame["start_station_number"] = pd.to_numeric(
             raw[resolved["start_station_number"]], errors="coerce"
@@ -551,22 +923,13 @@ def normalize_trip_frame(raw: pd.DataFrame, source_name: str) -> pd.DataFrame:
         frame["end_lon"] = pd.Series(index=raw.index, dtype="float64")
     frame["source_file"] = source_name
 
-    required = ["start_time", "end_time", "start_station", "end_station"]
-    frame = frame.dropna(subset=required).copy()
-    frame = frame[frame["end_time"] >= frame["start_time"]].copy()
-
     frame["trip_id"] = frame["trip_id"].fillna("").str.strip()
     missing_trip_id = frame["trip_id"] == ""
     if missing_trip_id.any():
-        seed = (
-            frame.loc[missing_trip_id, "start_time"].astype("int64").astype("string")
-            + "|"
-            + frame.loc[missing_trip_id, "end_time"].astype("int64").astype("string")
-            + "|"
-            + frame.loc[missing_trip_id, "start_station"]
-            + "|"
-            + frame.loc[missing_trip_id, "end_station"]
-        )
+        # Hash the typed columns directly; no per-row seed strings are built.
+        seed = frame.loc[
+            missing_trip_id, ["start_time", "end_time", "start_station", "end_station"]
+        ]
         frame.loc[missing_trip_id, "trip_id"] = "auto_" + pd.util.hash_pandas_object(
             seed, index=False
         ).astype("string")
@@ -587,54 +950,72 @@ def load_bikepoint_station_reference(
         if not isinstance(item, dict):
             continue
         station_id = str(item.get("id", ""))
-        match = re.search(r"(\d+)$", station_id)
+        match = _TRAILING_DIGITS.search(station_id)
         station_number = int(match.group(1)) if match else None
         records.append(
             {
                 "station_number": station_number,
-                "station_name": normalize_station_name(item.get("commonName", "")),
+                "station_name": item.get("commonName", ""),
                 "lat": pd.to_numeric(item.get("lat"), errors="coerce"),
                 "lon": pd.to_numeric(item.get("lon"), errors="coerce"),
             }
         )
 
     reference = pd.DataFrame.from_records(records).dropna(subset=["lat", "lon"])
+    reference["station_name"] = normalize_station_name_series(reference["station_name"])
     reference["station_number"] = pd.to_numeric(
         reference["station_number"], errors="coerce"
     ).astype("Int64")
     return reference
 
 
+def lookup_station_coordinates(keys: pd.Series, reference: pd.DataFrame) -> np.ndarray:
+    """Return an (n, 2) lat/lon array for keys via reference (indexed by key); NaN if unknown."""
+    # The extra NaN row is what position -1 (not found / null key) selects.
+    coordinates = np.vstack(
+        [reference[["lat", "lon"]].to_numpy(dtype="float64"), np.full((1, 2), np.nan)]
+    )
+    encoded = pa.array(keys)
+    if isinstance(encoded, pa.ChunkedArray):
+        encoded = encoded.unify_dictionaries().combine_chunks()
+    if not pa.types.is_dictionary(encoded.type):
+        return coordinates[reference.index.get_indexer(keys)]
+    # Look up each dictionary entry once, then expand through the codes.
+    positions = np.append(reference.index.get_indexer(encoded.dictionary.to_pandas()), -1)
+    codes = encoded.indices.fill_null(len(encoded.dictionary)).to_numpy()
+    return coordinates[positions[codes]]
+
+
+def station_centroids(samples: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Per-station median lat/lon, indexed by station."""
+    # Median, not mean: a few bad source coordinates must not drag a station.
+    return samples.groupby(key, sort=False)[["lat", "lon"]].median()
+
+
 def backfill_station_coordinates(
     trips: pd.DataFrame, station_reference: pd.DataFrame
 ) -> pd.DataFrame:
     """Backfill missing start/end coordinates using station number or station name."""
-    out = trips.copy()
-
-    by_number = station_reference.dropna(subset=["station_number"]).drop_duplicates(
-        subset=["station_number"], keep="first"
+    by_number = (
+        station_reference.dropna(subset=["station_number"])
+        .drop_duplicates(subset=["station_number"], keep="first")
+        .set_index("station_number")
     )
-    number_to_lat = by_number.set_index("station_number")["lat"].to_dict()
-    number_to_lon = by_number.set_index("station_number")["lon"].to_dict()
-
-    by_name = (
-        station_reference.groupby("station_name", as_index=False)
-        .agg({"lat": "median", "lon": "median"})
-        .set_index("station_name")
-    )
-    name_to_lat = by_name["lat"].to_dict()
-    name_to_lon = by_name["lon"].to_dict()
-
-    out["start_lat"] = out["start_lat"].fillna(out["start_station_number"].map(number_to_lat))
-    out["start_lon"] = out["start_lon"].fillna(out["start_station_number"].map(number_to_lon))
-    out["end_lat"] = out["end_lat"].fillna(out["end_station_number"].map(number_to_lat))
-    out["end_lon"] = out["end_lon"].fillna(out["end_station_number"].map(number_to_lon))
-
-    out["start_lat"] = out["start_lat"].fillna(out["start_station"].map(name_to_lat))
-    out["start_lon"] = out["start_lon"].fillna(out["start_station"].map(name_to_lon))
-    out["end_lat"] = out["end_lat"].fillna(out["end_station"].map(name_to_lat))
-    out["end_lon"] = out["end_lon"].fillna(out["end_station"].map(name_to_lon))
-    return out
+    by_name = station_centroids(station_reference, "station_name")
+
+    filled: dict[str, np.ndarray] = {}
+    for end in ("start", "end"):
+        coordinates = trips[[f"{end}_lat", f"{end}_lon"]].to_numpy(dtype="float64")
+        # Station number first, then station name, only where still missing.
+        lookups = ((trips[f"{end}_station_number"], by_number), (trips[f"{end}_station"], by_name))
+        for keys, reference in lookups:
+            missing = np.isnan(coordinates)
+            if not missing.any():
+                break
+            coordinates = np.where(missing, lookup_station_coordinates(keys, reference), coordinates)
+        filled[f"{end}_lat"] = coordinates[:, 0]
+        filled[f"{end}_lon"] = coordinates[:, 1]
+    return trips.assign(**filled)
 
 
 def standardize_station_coordinates(trips: pd.DataFrame) -> pd.DataFrame:
@@ -658,45 +1039,121 @@ def standardize_station_coordinates(trips: pd.DataFrame) -> pd.DataFrame:
         ignore_index=True,
     )
 
-    station_reference = (
-        station_samples.groupby("station", as_index=False)
-        .agg({"lat": "median", "lon": "median"})
-        .set_index("station")
-    )
+    station_reference = station_centroids(station_samples, "station")
     station_reference["lat"] = station_reference["lat"].round(6)
     station_reference["lon"] = station_reference["lon"].round(6)
 
-    out = trips.copy()
-    out = out.join(station_reference.rename(columns={"lat": "start_lat_ref", "lon": "start_lon_ref"}), on="start_station")
-    out = out.join(station_reference.rename(columns={"lat": "end_lat_ref", "lon": "end_lon_ref"}), on="end_station")
-    out["start_lat"] = out["start_lat_ref"].fillna(out["start_lat"])
-    out["start_lon"] = out["start_lon_ref"].fillna(out["start_lon"])
-    out["end_lat"] = out["end_lat_ref"].fillna(out["end_lat"])
-    out["end_lon"] = out["end_lon_ref"].fillna(out["end_lon"])
-    out = out.drop(columns=["start_lat_ref", "start_lon_ref", "end_lat_ref", "end_lon_ref"])
-
+    filled: dict[str, np.ndarray] = {}
+    for end in ("start", "end"):
+        original = trips[[f"{end}_lat", f"{end}_lon"]].to_numpy(dtype="float64")
+        centroid = lookup_station_coordinates(trips[f"{end}_station"], station_reference)
+        coordinates = np.where(np.isnan(centroid), original, centroid)
+        filled[f"{end}_lat"] = coordinates[:, 0]
+        filled[f"{end}_lon"] = coordinates[:, 1]
+
+    # NaN compares False, so rows without coordinates drop out as with between().
+    lat = np.column_stack([filled["start_lat"], filled["end_lat"]])
+    lon = np.column_stack([filled["start_lon"], filled["end_lon"]])
     mask = (
-        out["start_lat"].between(LONDON_LAT_MIN, LONDON_LAT_MAX)
-        & out["end_lat"].between(LONDON_LAT_MIN, LONDON_LAT_MAX)
-        & out["start_lon"].between(LONDON_LON_MIN, LONDON_LON_MAX)
-        & out["end_lon"].between(LONDON_LON_MIN, LONDON_LON_MAX)
-    )
-    filtered = out[mask].copy()
+        (lat >= LONDON_LAT_MIN) & (lat <= LONDON_LAT_MAX) & (lon >= LONDON_LON_MIN) & (lon <= LONDON_LON_MAX)
+    ).all(axis=1)
+    # Filter before assigning, so only the surviving rows are copied.
+    filtered = trips[mask].assign(**{name: values[mask] for name, values in filled.items()})
     LOGGER.info("Rows after London bbox filter: %d", len(filtered))
     return filtered
 
 
-def route_key(start_lon: float, start_lat: float, end_lon: float, end_lat: float) -> str:
-    return f"{start_lon:.6f}|{start_lat:.6f}|{end_lon:.6f}|{end_lat:.6f}"
+_ROUTE_KEY_STRUCT = struct.Struct("<iiii")
+
+
+def route_key(start_lon: float, start_lat: float, end_lon: float, end_lat: float) -> bytes:
+    """Pack a pair as four little-endian int32 microdegrees (16 bytes)."""
+    return _ROUTE_KEY_STRUCT.pack(
+        round(start_lon * 1e6), round(start_lat * 1e6), round(end_lon * 1e6), round(end_lat * 1e6)
+    )
+
+
+def route_keys(frame: pd.DataFrame) -> list[bytes]:
+    """Vectorized route_key over the start/end lon/lat columns of a frame."""
+    return _pack_route_keys(
+        frame[["start_lon", "start_lat", "end_lon", "end_lat"]].to_numpy(dtype="float64")
+    )
+
+
+def _pack_route_keys(coords: np.ndarray) -> list[bytes]:
+    micro = np.ascontiguousarray(np.rint(coords * 1e6), dtype="<i4")
+    # One 16-byte void item per row; tolist() yields the same bytes as route_key.
+    return micro.view(f"V{_ROUTE_KEY_STRUCT.size}").ravel().tolist()
+
+
+def _polyline6_int(value: float) -> int:
+    # Half-away-from-zero rounding, as the reference polyline encoder does.
+    return int(math.copysign(math.floor(math.fabs(value) * 1e6 + 0.5), value))
+
+
+@functools.lru_cache(maxsize=65_536)
+def _polyline_chunks(delta: int) -> str:
+    value = ~(delta << 1) if delta < 0 else delta << 1
+    chars = []
+    while value >= 0x20:
+        chars.append(chr((0x20 | (value & 0x1F)) + 63))
+        value >>= 5
+    chars.append(chr(value + 63))
+    return "".join(chars)
 
 
 def straight_line_polyline6(
     start_lon: float, start_lat: float, end_lon: float, end_lat: float
 ) -> str:
-    points = [(start_lat, start_lon)]
+    lat = _polyline6_int(start_lat)
+    lon = _polyline6_int(start_lon)
+    encoded = _polyline_chunks(lat) + _polyline_chunks(lon)
     if start_lon != end_lon or start_lat != end_lat:
-        points.append((end_lat, end_lon))
-    return polyline.encode(points, precision=6)
+        encoded += _polyline_chunks(_polyline6_int(end_lat) - lat)
+        encoded += _polyline_chunks(_polyline6_int(end_lon) - lon)
+    return encoded
+
+
+def straight_line_polyline6_batch(
+    start_lon: np.ndarray, start_lat: np.ndarray, end_lon: np.ndarray, end_lat: np.ndarray
+) -> np.ndarray:
+    """Vectorized straight_line_polyline6 over equal-length coordinate arrays."""
+    micro = np.column_stack([start_lat, start_lon, end_lat, end_lon]).astype("float64")
+    micro = np.copysign(np.floor(np.abs(micro) * 1e6 + 0.5), micro).astype("int64")
+    # Absolute start point, then the delta to the end point.
+    values = np.concatenate([micro[:, :2], micro[:, 2:] - micro[:, :2]], axis=1)
+    values = (values << 1) ^ (values >> 63)
+
+    chunk_count = 7  # ceil(35 / 5) covers any zigzagged int32 microdegree delta
+    shifts = np.arange(chunk_count, dtype="int64") * 5
+    shifted = values[:, :, None] >> shifts
+    chunks = shifted & 0x1F
+    # A value emits one chunk per non-empty 5-bit group, and at least one.
+    used = np.maximum(1, (shifted > 0).sum(axis=2))
+    position = np.arange(chunk_count)
+    chars = chunks + 63 + np.where(position < used[:, :, None] - 1, 0x20, 0)
+    keep = position < used[:, :, None]
+    # Stationary pairs encode only the start point, as the scalar version does.
+    keep[:, 2:] &= (values[:, 2:] != 0).any(axis=1)[:, None, None]
+    chars = np.where(keep, chars, 0).reshape(len(values), 4 * chunk_count).astype("uint8")
+
+    # Push padding to the end of each row, then read rows as NUL-padded strings.
+    order = np.argsort(chars == 0, axis=1, kind="stable")
+    packed = np.ascontiguousarray(np.take_along_axis(chars, order, axis=1))
+    return packed.view(f"S{packed.shape[1]}").ravel().astype(str)
+
+
+def encode_polyline6(coordinates: Iterable[tuple[float, float]]) -> str:
+    """Encode (lat, lon) pairs as a polyline6 string."""
+    parts: list[str] = []
+    prev_lat = prev_lon = 0
+    for lat, lon in coordinates:
+        lat_int = _polyline6_int(lat)
+        lon_int = _polyline6_int(lon)
+        parts.append(_polyline_chunks(lat_int - prev_lat))
+        parts.append(_polyline_chunks(lon_int - prev_lon))
+        prev_lat, prev_lon = lat_int, lon_int
+    return "".join(parts)
 
 
 def fetch_osrm_route(
@@ -752,98 +1209,306 @@ def fetch_osrm_route(
     )
 
 
-def load_route_cache(cache_path: Path) -> dict[str, RouteResult]:
-    if not cache_path.exists():
-        return {}
-
-    frame = pd.read_parquet(cache_path)
-    cache: dict[str, RouteResult] = {}
-    for row in frame.itertuples(index=False):
-        result = RouteResult(
-            start_lon=float(row.start_lon),
-            start_lat=float(row.start_lat),
-            end_lon=float(row.end_lon),
-            end_lat=float(row.end_lat),
-            route_geometry=str(row.route_geometry),
-            route_distance_m=float(row.route_distance_m),
-            route_duration_s=float(row.route_duration_s),
-            route_source=str(row.route_source),
+def fetch_osrm_routes_batch(
+    session: requests.Session,
+    osrm_base_url: str,
+    pairs: Sequence[tuple[float, float, float, float]],
+    timeout: int,
+) -> list[RouteResult]:
+    """Route several pairs sharing one origin with a single OSRM request.
+
+    The waypoint list alternates origin and destinations (o;d1;o;d2;...), so
+    every even leg is one requested pair. Leg geometries are rebuilt from the
+    step geometries because OSRM only returns overview geometry per route.
+    """
+    start_lon, start_lat = pairs[0][0], pairs[0][1]
+    origin = f"{start_lon:.6f},{start_lat:.6f}"
+    waypoints = ";".join(f"{origin};{end_lon:.6f},{end_lat:.6f}" for _, _, end_lon, end_lat in pairs)
+    response = session.get(
+        f"{osrm_base_url.rstrip('/')}/route/v1/bicycle/{waypoints}",
+        params={
+            "overview": "false",
+            "geometries": "geojson",
+            "steps": "true",
+            "alternatives": "false",
+            "continue_straight": "false",
+        },
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get("code") != "Ok" or not payload.get("routes"):
+        raise RuntimeError(f"OSRM returned no routes: {payload.get('code')}")
+
+    legs = payload["routes"][0].get("legs", [])
+    if len(legs) != 2 * len(pairs) - 1:
+        raise RuntimeError(f"OSRM returned {len(legs)} legs for {len(pairs)} batched pairs")
+
+    results: list[RouteResult] = []
+    for pair, leg in zip(pairs, legs[::2]):
+        points: list[tuple[float, float]] = []
+        for step in leg.get("steps", []):
+            for lon, lat in step["geometry"]["coordinates"]:
+                if not points or points[-1] != (lat, lon):
+                    points.append((lat, lon))
+        results.append(
+            RouteResult(
+                start_lon=pair[0],
+                start_lat=pair[1],
+                end_lon=pair[2],
+                end_lat=pair[3],
+                route_geometry=encode_polyline6(points),
+                route_distance_m=float(leg.get("distance", 0.0)),
+                route_duration_s=float(leg.get("duration", 0.0)),
+                route_source="osrm",
+            )
         )
-        cache[route_key(result.start_lon, result.start_lat, result.end_lon, result.end_lat)] = result
+    return results
+
+
+def route_cache_frame(results: Iterable[RouteResult]) -> pd.DataFrame:
+    """Build a route cache frame (one column per RouteResult field, indexed by route_key)."""
+    frame = pd.DataFrame.from_records(
+        list(map(_route_result_fields, results)), columns=list(ROUTE_CACHE_COLUMNS)
+    )
+    return _index_route_cache(frame)
+
+
+def _index_route_cache(frame: pd.DataFrame) -> pd.DataFrame:
+    frame = frame.astype(ROUTE_CACHE_DTYPES)
+    frame.index = pd.Index(route_keys(frame), dtype="object", name="route_key")
+    return frame
+
+
+def straight_line_route_cache(pairs: pd.DataFrame, route_source: str) -> pd.DataFrame:
+    """Route cache rows with straight-line geometry and zero distance for the given pairs."""
+    frame = pairs.assign(
+        route_geometry=straight_line_polyline6_batch(*pairs.to_numpy(dtype="float64").T),
+        route_distance_m=0.0,
+        route_duration_s=0.0,
+        route_source=route_source,
+    )
+    return _index_route_cache(frame[list(ROUTE_CACHE_COLUMNS)])
+
+
+def load_route_cache(cache_path: Path, keys: Iterable[bytes] | None = None) -> pd.DataFrame:
+    """Load the route cache, or only the rows whose route_key is in keys.
+
+    With keys, the file is scanned batch by batch and non-matching rows are
+    dropped before conversion, so memory follows the month's pairs rather than
+    the size of the whole cache.
+    """
+    if not cache_path.exists():
+        return route_cache_frame([])
+
+    if keys is None:
+        table = pq.read_table(cache_path, columns=list(ROUTE_CACHE_COLUMNS))
+    else:
+        wanted = pd.Index(keys, dtype="object")
+        parquet_file = pq.ParquetFile(cache_path)
+        hits: list[pa.RecordBatch] = []
+        for batch in parquet_file.iter_batches(
+            batch_size=ROUTE_CACHE_ROW_GROUP_ROWS, columns=list(ROUTE_CACHE_COLUMNS)
+        ):
+            is_wanted = wanted.get_indexer(_batch_route_keys(batch)) >= 0
+            if is_wanted.any():
+                hits.append(batch.filter(pa.array(is_wanted)))
+        schema = pa.schema([parquet_file.schema_arrow.field(name) for name in ROUTE_CACHE_COLUMNS])
+        table = pa.Table.from_batches(hits, schema=schema)
+    cache = _index_route_cache(table.to_pandas())
     LOGGER.info("Loaded %d cached routes", len(cache))
     return cache
 
 
-def save_route_cache(cache_path: Path, cache: dict[str, RouteResult]) -> None:
-    if not cache:
-        return
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    rows = [
-        {
-            "start_lon": result.start_lon,
-            "start_lat": result.start_lat,
-            "end_lon": result.end_lon,
-            "end_lat": result.end_lat,
-            "route_geometry": result.route_geometry,
-            "route_distance_m": result.route_distance_m,
-            "route_duration_s": result.route_duration_s,
-            "route_source": result.route_source,
-        }
-        for result in cache.values()
-    ]
-    frame = pd.DataFrame(rows).sort_values(
-        by=["start_lon", "start_lat", "end_lon", "end_lat"], ignore_index=True
+def _batch_route_keys(batch: pa.RecordBatch) -> list[bytes]:
+    coords = np.column_stack(
+        [batch.column(name).to_numpy(zero_copy_only=False) for name in ROUTE_CACHE_COLUMNS[:4]]
     )
-    frame.to_parquet(cache_path, compression="zstd", index=False)
-    LOGGER.info("Saved route cache with %d entries -> %s", len(frame), cache_path)
+    return _pack_route_keys(coords)
+
+
+def route_cache_lock(cache_path: Path) -> contextlib.AbstractContextManager[None]:
+    """Serialize route cache writers across processes sharing the same cache file."""
+    return path_lock(cache_path)
+
+
+def save_route_cache(cache_path: Path, cache: pd.DataFrame) -> int:
+    """Merge cache into the file at cache_path; return how many routes the file holds."""
+    with route_cache_lock(cache_path):
+        if cache.empty:
+            return pq.ParquetFile(cache_path).metadata.num_rows if cache_path.exists() else 0
+        # Another month may have saved routes since this process loaded the cache.
+        return _write_route_cache(cache_path, cache)
+
+
+def concat_route_caches(*caches: pd.DataFrame) -> pd.DataFrame:
+    """Stack route cache frames; later frames win on duplicate keys."""
+    non_empty = [cache for cache in caches if not cache.empty]
+    if not non_empty:
+        return caches[0]
+    if len(non_empty) == 1:
+        return non_empty[0]
+    merged = pd.concat(non_empty)
+    return merged[~merged.index.duplicated(keep="last")]
+
+
+ROUTE_CACHE_SORT_KEYS = [(name, "ascending") for name in ROUTE_CACHE_COLUMNS[:4]]
+
+
+def _route_cache_is_sorted(parquet_file: pq.ParquetFile) -> bool:
+    """Whether the file's row groups follow each other in start_lon order (per their stats)."""
+    metadata = parquet_file.metadata
+    column_index = parquet_file.schema_arrow.get_field_index("start_lon")
+    previous_max = float("-inf")
+    for row_group in range(metadata.num_row_groups):
+        stats = metadata.row_group(row_group).column(column_index).statistics
+        if stats is None or not stats.has_min_max or stats.min < previous_max:
+            return False
+        previous_max = stats.max
+    return True
+
+
+def _write_route_cache(cache_path: Path, cache: pd.DataFrame) -> int:
+    """Rewrite the cache file with cache's rows replacing any on-disk rows with the same key.
+
+    The existing file is streamed batch by batch and merged with the sorted new
+    rows, so only the rows being saved are held in memory and the file stays
+    sorted by coordinates (row-group stats are used for spatial sampling). A
+    file that is not sorted is read whole and re-sorted once.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    coord_columns = list(ROUTE_CACHE_COLUMNS[:4])
+    table = pa.Table.from_pandas(cache[list(ROUTE_CACHE_COLUMNS)], preserve_index=False)
+    table = table.replace_schema_metadata(None).sort_by(ROUTE_CACHE_SORT_KEYS)
+    new_keys = list(zip(*(table.column(name).to_pylist() for name in coord_columns)))
+
+    existing: Iterable[pa.RecordBatch] = ()
+    if cache_path.exists():
+        parquet_file = pq.ParquetFile(cache_path)
+        if _route_cache_is_sorted(parquet_file):
+            existing = parquet_file.iter_batches(
+                batch_size=ROUTE_CACHE_ROW_GROUP_ROWS, columns=list(ROUTE_CACHE_COLUMNS)
+            )
+        else:
+            existing = (
+                parquet_file.read(columns=list(ROUTE_CACHE_COLUMNS))
+                .sort_by(ROUTE_CACHE_SORT_KEYS)
+                .to_batches(max_chunksize=ROUTE_CACHE_ROW_GROUP_ROWS)
+            )
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    row_count = 0
+    buffered: list[pa.Table] = []
+    buffered_rows = 0
+    # The cache is rewritten on every save, so favour write speed: zstd level 1 is
+    # several times faster than the default at nearly the same size here.
+    with pq.ParquetWriter(
+        tmp_path,
+        table.schema,
+        compression="zstd",
+        compression_level=1,
+        use_dictionary=True,
+        data_page_size=1 << 20,
+        write_statistics=True,
+    ) as writer:
+
+        def emit(part: pa.Table, final: bool = False) -> None:
+            # Buffer merged output so every row group but the last is full size.
+            nonlocal buffered_rows
+            buffered.append(part)
+            buffered_rows += part.num_rows
+            full_rows = buffered_rows if final else buffered_rows - buffered_rows % ROUTE_CACHE_ROW_GROUP_ROWS
+            if full_rows == 0:
+                return
+            merged = pa.concat_tables(buffered)
+            writer.write_table(merged.slice(0, full_rows), row_group_size=ROUTE_CACHE_ROW_GROUP_ROWS)
+            buffered[:] = [merged.slice(full_rows)]
+            buffered_rows -= full_rows
+
+        next_new = 0
+        for batch in existing:
+            is_kept = cache.index.get_indexer(_batch_route_keys(batch)) < 0
+            kept = pa.Table.from_batches([batch.filter(pa.array(is_kept))]).cast(table.schema)
+            if kept.num_rows == 0:
+                continue
+            # Interleave the new rows that sort at or before this batch's last row.
+            last_key = tuple(kept.column(name)[-1].as_py() for name in coord_columns)
+            stop = bisect.bisect_right(new_keys, last_key, lo=next_new)
+            part = pa.concat_tables([kept, table.slice(next_new, stop - next_new)])
+            emit(part.sort_by(ROUTE_CACHE_SORT_KEYS) if stop > next_new else part)
+            row_count += part.num_rows
+            next_new = stop
+        emit(table.slice(next_new), final=True)
+        row_count += table.num_rows - next_new
+    os.replace(tmp_path, cache_path)
+    LOGGER.info("Saved route cache with %d entries -> %s", row_count, cache_path)
+    return row_count
 
 
 def hydrate_routes(
     trips: pd.DataFrame,
-    cache: dict[str, RouteResult],
+    cache: pd.DataFrame,
     osrm_base_url: str,
     timeout: int,
     osrm_workers: int,
     osrm_qps: float,
     max_new_routes: int | None,
-) -> dict[str, RouteResult]:
-    unique_pairs = (
-        trips[["start_lon", "start_lat", "end_lon", "end_lat"]]
-        .round(6)
-        .drop_duplicates(ignore_index=True)
-    )
-    missing: list[tuple[float, float, float, float]] = []
-    for row in unique_pairs.itertuples(index=False):
-        key = route_key(row.start_lon, row.start_lat, row.end_lon, row.end_lat)
-        if key not in cache:
-            missing.append((row.start_lon, row.start_lat, row.end_lon, row.end_lat))
-
-    if not missing:
+    cache_path: Path | None = None,
+) -> pd.DataFrame:
+    """Return the cache extended with a row for every route pair in trips.
+
+    With cache_path set, fetched routes are also saved there every
+    OSRM_CHECKPOINT_ROUTES results, so a crashed run does not refetch them.
+    """
+    coords = trips[["start_lon", "start_lat", "end_lon", "end_lat"]]
+    # Reuse the caller's route_key column when present (process_month builds it).
+    # Dedupe on the packed key, not the float tuple: distinct floats can round to
+    # the same microdegrees and must not be fetched (or cached) twice.
+    # Coordinates are rounded exactly once: process_month rounds the columns before
+    # building route_key, otherwise they are rounded here ahead of packing.
+    if "route_key" in trips.columns:
+        row_keys = pd.Index(trips["route_key"], dtype="object")
+    else:
+        coords = coords.round(6)
+        row_keys = pd.Index(route_keys(coords), dtype="object")
+    first_seen = ~row_keys.duplicated()
+    unique_pairs = coords[first_seen]
+    is_missing = cache.index.get_indexer(row_keys[first_seen]) < 0
+    missing_pairs = unique_pairs[is_missing]
+
+    if missing_pairs.empty:
         LOGGER.info("All route pairs already cached.")
         return cache
 
-    limiter = RateLimiter(osrm_qps)
-    session_local = threading.local()
+    # Let every worker start at once, but never allow more than a second's worth.
+    limiter = RateLimiter(osrm_qps, burst=max(1, min(osrm_workers, int(osrm_qps))))
+    # One session for all workers: a single keep-alive pool sized to the worker
+    # count instead of a separate pool (and TLS handshake) per thread. Only
+    # osrm_workers requests run at once, so a larger pool would never be used.
+    session = build_http_session(pool_maxsize=osrm_workers)
 
-    def get_session() -> requests.Session:
-        session = getattr(session_local, "session", None)
-        if session is None:
-            session = build_http_session()
-            session_local.session = session
-        return session
-
-    fetch_count = len(missing)
+    fetch_count = len(missing_pairs)
     if max_new_routes is not None and fetch_count > max_new_routes:
         LOGGER.warning(
             "Capping OSRM fetches at %d (requested %d unique pairs).",
             max_new_routes,
             fetch_count,
         )
-        to_fetch = missing[:max_new_routes]
-        to_fallback = missing[max_new_routes:]
+        fetch_pairs = missing_pairs.iloc[:max_new_routes]
+        to_fallback = missing_pairs.iloc[max_new_routes:]
     else:
-        to_fetch = missing
-        to_fallback = []
+        fetch_pairs = missing_pairs
+        to_fallback = missing_pairs.iloc[:0]
+    # Stationary pairs never reach OSRM; encode them in bulk instead of spending
+    # a worker task and a rate-limiter slot on each.
+    is_stationary = (
+        (fetch_pairs["start_lon"] == fetch_pairs["end_lon"])
+        & (fetch_pairs["start_lat"] == fetch_pairs["end_lat"])
+    ).to_numpy()
+    stationary = fetch_pairs[is_stationary]
+    to_fetch: list[tuple[float, float, float, float]] = list(
+        fetch_pairs[~is_stationary].itertuples(index=False, name=None)
+    )
 
     total_to_fetch = len(to_fetch)
     LOGGER.info(
@@ -859,7 +1524,7 @@ def hydrate_routes(
         limiter.wait()
         try:
             return fetch_osrm_route(
-                session=get_session(),
+                session=session,
                 osrm_base_url=osrm_base_url,
                 start_lon=start_lon,
                 start_lat=start_lat,
@@ -880,21 +1545,67 @@ def hydrate_routes(
                 route_source="fallback_straight_line",
             )
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=osrm_workers) as pool:
-        futures = {pool.submit(fetch_pair, pair): pair for pair in to_fetch}
+    def fetch_batch(batch: list[tuple[float, float, float, float]]) -> list[RouteResult]:
+        if len(batch) == 1:
+            return [fetch_pair(batch[0])]
+        limiter.wait()
+        try:
+            return fetch_osrm_routes_batch(
+                session=session,
+                osrm_base_url=osrm_base_url,
+                pairs=batch,
+                timeout=timeout,
+            )
+        except Exception as exc:  # noqa: BLE001
+            # One unroutable destination fails the whole request; retry singly.
+            LOGGER.debug("OSRM batch of %d failed (%s); fetching pairs singly", len(batch), exc)
+            return [fetch_pair(pair) for pair in batch]
+
+    batches: list[list[tuple[float, float, float, float]]] = []
+    by_origin: dict[tuple[float, float], list[tuple[float, float, float, float]]] = {}
+    for pair in to_fetch:
+        group = by_origin.setdefault((pair[0], pair[1]), [])
+        group.append(pair)
+        if len(group) == OSRM_BATCH_SIZE:
+            batches.append(group)
+            by_origin[(pair[0], pair[1])] = []
+    batches.extend(group for group in by_origin.values() if group)
+
+    new_routes: list[RouteResult] = []
+    with session, concurrent.futures.ThreadPoolExecutor(max_workers=osrm_workers) as pool:
+        # Keep a bounded window of batches in flight instead of queueing every
+        # batch up front: pending work stays O(workers), not O(pairs).
+        pending_batches = iter(batches)
+        in_flight = {
+            pool.submit(fetch_batch, batch)
+            for batch in itertools.islice(pending_batches, osrm_workers * OSRM_IN_FLIGHT_PER_WORKER)
+        }
         completed = 0
+        checkpointed = 0
         started_at = time.monotonic()
         last_progress_log_at = started_at
         progress_interval_count = max(50, total_to_fetch // 100 if total_to_fetch else 1)
-        for future in concurrent.futures.as_completed(futures):
-            completed += 1
-            result = future.result()
-            key = route_key(result.start_lon, result.start_lat, result.end_lon, result.end_lat)
-            cache[key] = result
+        next_progress_count = progress_interval_count
+        while in_flight:
+            done, in_flight = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                results = future.result()
+                new_routes.extend(results)
+                completed += len(results)
+            in_flight.update(
+                pool.submit(fetch_batch, batch) for batch in itertools.islice(pending_batches, len(done))
+            )
+            if cache_path is not None and completed - checkpointed >= OSRM_CHECKPOINT_ROUTES:
+                # Only the routes since the last checkpoint; save merges them into the file.
+                save_route_cache(cache_path, route_cache_frame(new_routes[checkpointed:]))
+                checkpointed = completed
             now = time.monotonic()
-            should_log_by_count = completed % progress_interval_count == 0
+            should_log_by_count = completed >= next_progress_count
             should_log_by_time = now - last_progress_log_at >= 10.0
             if should_log_by_count or should_log_by_time or completed == total_to_fetch:
+                next_progress_count = (completed // progress_interval_count + 1) * progress_interval_count
                 elapsed_s = max(now - started_at, 1e-6)
                 rate = completed / elapsed_s
                 remaining = max(total_to_fetch - completed, 0)
@@ -910,54 +1621,103 @@ def hydrate_routes(
                 )
                 last_progress_log_at = now
 
-    for start_lon, start_lat, end_lon, end_lat in to_fallback:
-        result = RouteResult(
-            start_lon=start_lon,
-            start_lat=start_lat,
-            end_lon=end_lon,
-            end_lat=end_lat,
-            route_geometry=straight_line_polyline6(start_lon, start_lat, end_lon, end_lat),
-            route_distance_m=0.0,
-            route_duration_s=0.0,
-            route_source="fallback_max_new_routes",
-        )
-        cache[route_key(start_lon, start_lat, end_lon, end_lat)] = result
+    # Missing pairs are already unique by route_key (first_seen above), so each
+    # straight-line polyline is encoded once.
+    return concat_route_caches(
+        cache,
+        straight_line_route_cache(stationary, "stationary"),
+        route_cache_frame(new_routes),
+        straight_line_route_cache(to_fallback, "fallback_max_new_routes"),
+    )
 
-    return cache
+
+DAILY_PARQUET_SCHEMA = pa.schema(
+    [
+        ("trip_id", pa.string()),
+        ("start_time", pa.timestamp("us", tz="UTC")),
+        ("end_time", pa.timestamp("us", tz="UTC")),
+        ("route_geometry", pa.large_string()),
+        ("route_source", pa.string()),
+        ("route_distance_m", pa.float64()),
+        ("route_duration_s", pa.float64()),
+    ]
+)
+DAILY_PARQUET_COLUMNS = DAILY_PARQUET_SCHEMA.names
+# A day of trips fits comfortably in one row group.
+DAILY_ROW_GROUP_ROWS = 500_000
+# Recorded in each day file so a later recompress pass can skip files already at its level.
+DAILY_ZSTD_LEVEL_METADATA_KEY = b"locatr.zstd_level"
 
 
-def write_daily_parquet(trips: pd.DataFrame, out_dir: Path) -> list[Path]:
+def daily_parquet_write_options(compression_level: int) -> dict[str, object]:
+    """Parquet writer options shared by daily writes and later recompression."""
+    return {
+        "compression": "zstd",
+        "compression_level": compression_level,
+        "use_dictionary": ["route_geometry", "route_source"],
+        # Only the time columns are filtered on by readers.
+        "write_statistics": ["start_time", "end_time"],
+        "data_page_size": 1 << 20,
+    }
+
+
+def write_daily_parquet(
+    trips: pd.DataFrame, out_dir: Path, compression_level: int = DAILY_ZSTD_LEVEL
+) -> list[Path]:
     out_dir.mkdir(parents=True, exist_ok=True)
-    file_paths: list[Path] = []
-    for day, day_frame in trips.groupby(trips["start_time"].dt.date, sort=True):
-        ordered = day_frame.sort_values("start_time").reset_index(drop=True)
-        target = out_dir / f"{day.isoformat()}.parquet"
-        table = pa.Table.from_pandas(
-            ordered[
-                [
-                    "trip_id",
-                    "start_time",
-                    "end_time",
-                    "route_geometry",
-                    "route_source",
-                    "route_distance_m",
-                    "route_duration_s",
-                ]
-            ],
-            preserve_index=False,
-        )
-        pq.write_table(
+    # The client scans windows with start_time < end AND end_time >= start, so both
+    # columns are clustered to keep row-group min/max statistics tight.
+    ordered = trips.sort_values(["start_time", "end_time"], kind="stable")[DAILY_PARQUET_COLUMNS]
+    table = pa.Table.from_pandas(ordered, schema=DAILY_PARQUET_SCHEMA, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            DAILY_ZSTD_LEVEL_METADATA_KEY: str(compression_level).encode(),
+        }
+    )
+    table = table.append_column("trip_date", pc.cast(table["start_time"], pa.date32()))
+
+    parquet_format = ds.ParquetFileFormat()
+    # write_dataset encodes and compresses partitions on Arrow's CPU pool with the
+    # GIL released, so days are already written in parallel; a process pool would
+    # only add a pickle of every day's frame on top.
+    # Months running in parallel share out_dir, so each write gets its own staging dir.
+    staging_dir = Path(tempfile.mkdtemp(prefix=".daily-", dir=out_dir))
+    try:
+        ds.write_dataset(
             table,
-            target,
-            compression="zstd",
-            use_dictionary=["route_geometry"],
-            row_group_size=50_000,
+            staging_dir,
+            format=parquet_format,
+            partitioning=ds.partitioning(pa.schema([("trip_date", pa.date32())]), flavor="hive"),
+            file_options=parquet_format.make_write_options(
+                **daily_parquet_write_options(compression_level)
+            ),
+            # The writer otherwise flushes a row group per 32k-row input batch.
+            min_rows_per_group=DAILY_ROW_GROUP_ROWS,
+            max_rows_per_group=DAILY_ROW_GROUP_ROWS,
+            preserve_order=True,
+            use_threads=True,
         )
-        file_paths.append(target)
+        file_paths: list[Path] = []
+        for partition_dir in sorted(staging_dir.glob("trip_date=*")):
+            target = out_dir / f"{partition_dir.name.split('=', 1)[1]}.parquet"
+            os.replace(partition_dir / "part-0.parquet", target)
+            file_paths.append(target)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
     return file_paths
 
 
-def process_month(args: argparse.Namespace) -> dict[str, object]:
+def ingest_csv(csv_path: Path, month_start: datetime, month_end: datetime) -> pd.DataFrame:
+    """Read and normalize one trip CSV (module-level so process pools can pickle it)."""
+    LOGGER.info("Reading CSV: %s", csv_path)
+    raw = read_csv_arrow(csv_path)
+    return normalize_trip_frame(
+        raw, source_name=csv_path.name, month_start=month_start, month_end=month_end
+    )
+
+
+def process_month(args: argparse.Namespace | MonthJob) -> dict[str, object]:
     month_start, month_end = parse_month(args.month)
     session = build_http_session()
 
@@ -966,32 +1726,39 @@ def process_month(args: argparse.Namespace) -> dict[str, object]:
         base_url=args.tfl_base_url,
         month_start=month_start,
         month_end=month_end,
+        listing_cache_path=Path(args.download_dir) / DISCOVERY_CACHE_NAME,
     )
     artifacts = download_files(session, discovered_urls, Path(args.download_dir))
     csv_paths = extract_csv_paths(artifacts, Path(args.extract_dir))
 
-    normalized_frames: list[pd.DataFrame] = []
-    for csv_path in csv_paths:
-        LOGGER.info("Reading CSV: %s", csv_path)
-        raw = pd.read_csv(csv_path, low_memory=False)
-        normalized = normalize_trip_frame(raw, source_name=csv_path.name)
-        normalized = normalized[
-            (normalized["start_time"] >= month_start) & (normalized["start_time"] < month_end)
-        ].copy()
+    # Files are independent and normalization is mostly single-threaded pandas,
+    # so parse + normalize each CSV in its own process.
+    ingest = functools.partial(ingest_csv, month_start=month_start, month_end=month_end)
+    ingest_workers = min(args.ingest_workers or os.cpu_count() or 1, len(csv_paths))
+    if ingest_workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=ingest_workers) as pool:
+            normalized_frames = list(pool.map(ingest, csv_paths))
+    else:
+        normalized_frames = list(map(ingest, csv_paths))
+    for csv_path, normalized in zip(csv_paths, normalized_frames):
         LOGGER.info(
             "Prepared %d rows from %s after normalization + month filter",
             len(normalized),
             csv_path.name,
         )
-        normalized_frames.append(normalized)
 
     if not normalized_frames:
         raise RuntimeError("No trips found in source files.")
 
     trips = pd.concat(normalized_frames, ignore_index=True)
-    trips = trips.drop_duplicates(
-        subset=["trip_id", "start_time", "end_time", "start_station", "end_station"]
-    )
+    # Rows can only be exact repeats if their trip_id repeats, so hash the single
+    # trip_id column first and compare all five columns on that subset only.
+    repeated_id = trips["trip_id"].duplicated(keep=False)
+    if repeated_id.any():
+        is_repeat = trips.loc[
+            repeated_id, ["trip_id", "start_time", "end_time", "start_station", "end_station"]
+        ].duplicated()
+        trips = trips.drop(index=is_repeat.index[is_repeat])
     station_reference = load_bikepoint_station_reference(
         session=session, timeout=args.request_timeout
     )
@@ -1008,12 +1775,11 @@ def process_month(args: argparse.Namespace) -> dict[str, object]:
         )
 
     trips = trips.round({"start_lon": 6, "start_lat": 6, "end_lon": 6, "end_lat": 6})
-    trips["route_key"] = trips.apply(
-        lambda row: route_key(row.start_lon, row.start_lat, row.end_lon, row.end_lat), axis=1
-    )
+    trips["route_key"] = route_keys(trips)
 
     cache_path = Path(args.route_cache)
-    route_cache = load_route_cache(cache_path)
+    # Only this month's pairs are needed; the rest of the cache stays on disk.
+    route_cache = load_route_cache(cache_path, keys=trips["route_key"].unique())
     route_cache = hydrate_routes(
         trips=trips,
         cache=route_cache,
@@ -1022,34 +1788,38 @@ def process_month(args: argparse.Namespace) -> dict[str, object]:
         osrm_workers=args.osrm_workers,
         osrm_qps=args.osrm_qps,
         max_new_routes=args.max_new_routes,
+        cache_path=cache_path,
     )
-    save_route_cache(cache_path, route_cache)
-
-    trips["route_geometry"] = trips["route_key"].map(
-        lambda key: route_cache[key].route_geometry
-        if key in route_cache
-        else straight_line_polyline6(0.0, 0.0, 0.0, 0.0)
-    )
-    trips["route_source"] = trips["route_key"].map(
-        lambda key: route_cache[key].route_source if key in route_cache else "fallback_missing"
-    )
-    trips["route_distance_m"] = trips["route_key"].map(
-        lambda key: route_cache[key].route_distance_m if key in route_cache else 0.0
-    )
-    trips["route_duration_s"] = trips["route_key"].map(
-        lambda key: route_cache[key].route_duration_s if key in route_cache else 0.0
+    route_cache_size = save_route_cache(cache_path, route_cache)
+
+    # Resolve each distinct key once, then broadcast the route fields by code.
+    codes, unique_keys = pd.factorize(trips["route_key"])
+    # Only the route fields are attached to trips; the coordinate columns stay behind.
+    matched = route_cache.reindex(
+        index=pd.Index(unique_keys, dtype="object"),
+        columns=["route_geometry", "route_distance_m", "route_duration_s", "route_source"],
     )
+    route_fields = {
+        "route_geometry": matched["route_geometry"].fillna(straight_line_polyline6(0.0, 0.0, 0.0, 0.0)),
+        "route_distance_m": matched["route_distance_m"].fillna(0.0),
+        "route_duration_s": matched["route_duration_s"].fillna(0.0),
+    }
+    for column, values in route_fields.items():
+        trips[column] = values.to_numpy()[codes]
+    # A handful of distinct sources: keep them as integer codes, not a str per row.
+    sources = pd.Categorical(matched["route_source"].fillna("fallback_missing"))
+    trips["route_source"] = pd.Categorical.from_codes(sources.codes[codes], sources.categories)
     trips = trips.drop(columns=["route_key", "source_file"])
 
     parquet_dir = Path(args.output_dir)
-    parquet_paths = write_daily_parquet(trips, parquet_dir)
+    parquet_paths = write_daily_parquet(trips, parquet_dir, compression_level=args.zstd_level)
     metadata_path = write_dataset_manifest(
         parquet_dir=parquet_dir,
         month=args.month,
         run_trip_count=len(trips),
         run_start_time=trips["start_time"].min(),
         run_end_time=trips["end_time"].max(),
-        route_cache_size=len(route_cache),
+        route_cache_size=route_cache_size,
     )
 
     LOGGER.info("Pipeline complete.")
@@ -1145,6 +1915,18 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional cap on new OSRM lookups in this run. Overflow uses straight-line fallback.",
     )
+    parser.add_argument(
+        "--ingest-workers",
+        type=int,
+        default=None,
+        help="Processes used to parse and normalize source CSVs (default: min(files, CPU count)).",
+    )
+    parser.add_argument(
+        "--zstd-level",
+        type=int,
+        default=DAILY_ZSTD_LEVEL,
+        help="zstd compression level for the daily parquet files.",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",